@@ -13,5 +13,8 @@ RAW_DATA_FILES = {m: [RAW_DATA_DIR / m / f"{s}.csv" for s in DATA_STEMS[m]] for
 PASSES_DIR = DATA_DIR / "passes"
 PASSES_FILES = {m: [PASSES_DIR / m / f"{s}.csv" for s in DATA_STEMS[m]] for m in DATA_STEMS}
 
+# measured pass temperatures further below the median of their pass are disturbed readings
+TEMPERATURE_OUTLIER_DISTANCE = 30
+
 PAUSES_BINS = 20
 MAX_PAUSE = 15
@@ -0,0 +1,9 @@
+import pandas as pd
+
+from weiner_variation.data.config import TEMPERATURE_OUTLIER_DISTANCE
+
+
+def filter_temperatures(temperatures: pd.DataFrame) -> pd.DataFrame:
+    """Measured temperatures with readings more than ``TEMPERATURE_OUTLIER_DISTANCE`` below the median of their column
+    masked as missing."""
+    return temperatures.where(temperatures > temperatures.median() - TEMPERATURE_OUTLIER_DISTANCE)
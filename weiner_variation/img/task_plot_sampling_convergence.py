@@ -0,0 +1,47 @@
+import matplotlib.pyplot as plt
+import pandas as pd
+
+from weiner_variation.config import DATA_DIR, IMG_DIR, ROOT_DIR
+from weiner_variation.sim.sampling import SAMPLERS
+
+SAMPLER_LABELS = {
+    "mc": "Pseudo-Random",
+    "sobol": "Scrambled Sobol'",
+    "lhs": "Latin Hypercube",
+}
+
+
+def task_plot_sampling_convergence(
+    produces=[IMG_DIR / f"plot_sampling_convergence.{suffix}" for suffix in ["png", "pdf", "svg"]],
+    data=DATA_DIR / "sampling_convergence.csv",
+    config=ROOT_DIR / "config.py",
+):
+    df = pd.read_csv(data)
+
+    fig: plt.Figure = plt.figure(figsize=(6.4, 2.5), dpi=600)
+    axs: list[plt.Axes] = fig.subplots(ncols=2, sharey="all")
+
+    for ax, prop, label in zip(
+        axs,
+        ["out_profile_temperature", "roll_force"],
+        ["Workpiece Temperature $\\Temperature$", "Roll Force $\\RollForce$"],
+        strict=True,
+    ):
+        ax.set_title(label)
+        ax.set_xlabel("Sample Count")
+        ax.set_xscale("log", base=2)
+        ax.set_yscale("log")
+        ax.grid(True)
+
+        for i, sampler in enumerate(SAMPLERS):
+            d = df[df["sampler"] == sampler]
+            ax.plot(d["sample_count"], d[prop], c=f"C{i}", marker="+", label=SAMPLER_LABELS[sampler])
+
+    axs[0].set_ylabel("Rel. Spread of\nStandard Deviation")
+    axs[0].legend()
+
+    fig.tight_layout()
+    for f in produces:
+        fig.savefig(f)
+
+    plt.close(fig)
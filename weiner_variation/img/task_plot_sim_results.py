@@ -11,8 +11,11 @@ from scipy.stats import linregress
 
 from weiner_variation.config import DATA_DIR, IMG_DIR, MATERIAL, ROOT_DIR
 from weiner_variation.data.config import PASSES_FILES
+from weiner_variation.data.measurements import filter_temperatures
+from weiner_variation.sim.config import FACTORS
 from weiner_variation.sim.process import PASS_SEQUENCE
-from weiner_variation.sim.task_sim_stds import FACTORS
+from weiner_variation.sim.statistics import boxplot_stats
+from weiner_variation.sim.store import load_results, load_summary
 
 UNIT_POSITIONS = np.arange(len(PASS_SEQUENCE))
 PASS_POSITIONS = UNIT_POSITIONS[[isinstance(u, pr.RollPass) for u in PASS_SEQUENCE]]
@@ -54,11 +57,11 @@ def _reindex_out(data):
 
 
 def _load_sim_data(file):
-    return pd.read_csv(file, index_col=0, header=[0, 1])
+    return load_summary(file)
 
 
 def _load_nominal_data(file):
-    return pd.read_csv(file, index_col=0, header=[0, 1])
+    return load_results(file)
 
 
 def _load_exp_data(files):
@@ -97,8 +100,8 @@ for sim, color in zip(
     ["input", "durations"], [INPUT_COLOR, DURATIONS_COLOR, ELASTIC_COLOR], strict=False
 ):
     dep_files = {
-        "nominal": DATA_DIR / "sim_nominal_results.csv",
-        "sim": DATA_DIR / f"sim_{sim}_results.csv",
+        "nominal": DATA_DIR / "sim_nominal_results",
+        "sim": DATA_DIR / f"sim_{sim}_results",
         "exp": EXP_FILES,
         "config": ROOT_DIR / "config.py",
     }
@@ -120,8 +123,8 @@ for sim, color in zip(
             ax.set_ylabel("Roll Force $\\RollForce$ in \\unit{\\kilo\\newton}")
             ax.set_ylim(0, 400)
 
-            sim_boxes = ax.boxplot(
-                df_sim.roll_force / 1e3,
+            sim_boxes = ax.bxp(
+                boxplot_stats(df_sim.roll_force, 1e-3),
                 positions=PASS_POSITIONS,
                 **boxplot_props(color),
             )
@@ -158,8 +161,8 @@ for sim, color in zip(
             ax.set_ylabel("Roll Torque $\\RollTorque$ in \\unit{\\kilo\\newton\\meter}")
             ax.set_ylim(0, 12)
 
-            sim_boxes = ax.boxplot(
-                df_sim.roll_roll_torque / 1e3,
+            sim_boxes = ax.bxp(
+                boxplot_stats(df_sim.roll_roll_torque, 1e-3),
                 positions=PASS_POSITIONS,
                 **boxplot_props(color),
             )
@@ -198,14 +201,14 @@ for sim, color in zip(
             ax.set_ylabel("Workpiece Temperature $\\Temperature$ in \\unit{\\kelvin}")
             ax.set_ylim(1100, 1500)
 
-            ax.boxplot(
-                df_sim.in_profile_temperature,
+            ax.bxp(
+                boxplot_stats(df_sim.in_profile_temperature),
                 positions=UNIT_POSITIONS - 0.5,
                 widths=0.25,
                 **boxplot_props(color),
             )
-            sim_boxes = ax.boxplot(
-                df_sim.out_profile_temperature,
+            sim_boxes = ax.bxp(
+                boxplot_stats(df_sim.out_profile_temperature),
                 positions=UNIT_POSITIONS + 0.5,
                 widths=0.25,
                 **boxplot_props(color),
@@ -213,8 +216,8 @@ for sim, color in zip(
 
             sim_mean = pd.concat(
                 [
-                    _reindex_in(df_sim.in_profile_temperature.mean()),
-                    _reindex_out(df_sim.out_profile_temperature.mean()),
+                    _reindex_in(df_sim.in_profile_temperature.loc["mean"]),
+                    _reindex_out(df_sim.out_profile_temperature.loc["mean"]),
                 ]
             ).sort_index()
             sim_mean_line = ax.plot(sim_mean, c=color, alpha=0.5, label="mean", ls="--")
@@ -288,15 +291,15 @@ for sim, color in zip(
             ax.set_ylabel("Mean Grain Size $\\GrainSize$ in \\unit{\\micro\\meter}")
             # ax.set_ylim(1100, 1500)
 
-            ax.boxplot(
-                df_sim.in_profile_grain_size * 1e6,
+            ax.bxp(
+                boxplot_stats(df_sim.in_profile_grain_size, 1e6),
                 positions=UNIT_POSITIONS - 0.5,
                 widths=0.25,
                 **boxplot_props(color),
             )
             
-            sim_boxes = ax.boxplot(
-                df_sim.out_profile_grain_size * 1e6,
+            sim_boxes = ax.bxp(
+                boxplot_stats(df_sim.out_profile_grain_size, 1e6),
                 positions=UNIT_POSITIONS + 0.5,
                 widths=0.25,
                 **boxplot_props(color),
@@ -304,8 +307,8 @@ for sim, color in zip(
 
             sim_mean = pd.concat(
                 [
-                    _reindex_in(df_sim.in_profile_grain_size.mean()),
-                    _reindex_out(df_sim.out_profile_grain_size.mean()),
+                    _reindex_in(df_sim.in_profile_grain_size.loc["mean"]),
+                    _reindex_out(df_sim.out_profile_grain_size.loc["mean"]),
                 ]
             ).sort_index()
             sim_mean_line = ax.plot(
@@ -353,8 +356,8 @@ for sim, color in zip(
             ax.set_ylabel("Filling Ratio $\\FillingRatio$")
             ax.set_ylim(0.7, 1.1)
 
-            sim_boxes = ax.boxplot(
-                df_sim.out_profile_filling_ratio,
+            sim_boxes = ax.bxp(
+                boxplot_stats(df_sim.out_profile_filling_ratio),
                 positions=UNIT_POSITIONS,
                 **boxplot_props(color),
             )
@@ -383,19 +386,19 @@ for sim, color in zip(
             IMG_DIR / f"plot_{sim}_temperature_correlation.{suffix}"
             for suffix in ["png", "pdf", "svg"]
         ],
-        results=DATA_DIR / f"sim_{sim}_results.csv",
+        results=DATA_DIR / f"sim_{sim}_results",
         config=ROOT_DIR / "config.py",
     ):
         XMAX = 70
 
         df = _load_sim_data(results)
-        temperature_changes = df.temperature_change.mean().abs()
+        temperature_changes = df.temperature_change.loc["mean"].abs()
         temperature_changes.iloc[PASS_POSITIONS] += (
-            df.temperature_change_by_deformation.mean().abs().dropna()
+            df.temperature_change_by_deformation.loc["mean"].abs().dropna()
         )
         std_changes = (
-            df["out_profile_temperature"].std() - df["in_profile_temperature"].std()
-        ).abs() / df["in_profile_temperature"].std()
+            df["out_profile_temperature"].loc["std"] - df["in_profile_temperature"].loc["std"]
+        ).abs() / df["in_profile_temperature"].loc["std"]
 
         fig: plt.Figure = plt.figure(figsize=(6.4, 2.5), dpi=600)
         ax: plt.Axes = fig.add_subplot()
@@ -449,8 +452,8 @@ def task_plot_temperature_std(
         produces=[
             IMG_DIR / f"plot_temperature_std.{suffix}" for suffix in ["png", "pdf", "svg"]
         ],
-        input=DATA_DIR / "sim_input_results.csv",
-        durations=DATA_DIR / "sim_durations_results.csv",
+        input=DATA_DIR / "sim_input_results",
+        durations=DATA_DIR / "sim_durations_results",
         exp=EXP_FILES,
         config=ROOT_DIR / "config.py",
 ):
@@ -467,32 +470,24 @@ def task_plot_temperature_std(
 
         std1 = pd.concat(
             [
-                _reindex_in(df_input.in_profile_temperature.std()),
-                _reindex_out(df_input.out_profile_temperature.std()),
+                _reindex_in(df_input.in_profile_temperature.loc["std"]),
+                _reindex_out(df_input.out_profile_temperature.loc["std"]),
             ]
         ).sort_index()
         ax.plot(std1, label="Only Varied Input", c=INPUT_COLOR)
 
         std2 = pd.concat(
             [
-                _reindex_in(df_durations.in_profile_temperature.std()),
-                _reindex_out(df_durations.out_profile_temperature.std()),
+                _reindex_in(df_durations.in_profile_temperature.loc["std"]),
+                _reindex_out(df_durations.out_profile_temperature.loc["std"]),
             ]
         ).sort_index()
         ax.plot(std2, label="With Varied Durations", c=DURATIONS_COLOR)
 
         std3 = pd.concat(
             [
-                _reindex_in(
-                    df_exp.in_temperature[
-                        df_exp.in_temperature > df_exp.in_temperature.median() - 30
-                        ].std()
-                ),
-                _reindex_out(
-                    df_exp.out_temperature[
-                        df_exp.out_temperature > df_exp.out_temperature.median() - 30
-                        ].std()
-                ),
+                _reindex_in(filter_temperatures(df_exp.in_temperature).std()),
+                _reindex_out(filter_temperatures(df_exp.out_temperature).std()),
             ]
         ).sort_index()
         std3.dropna()
@@ -516,7 +511,7 @@ def task_plot_temperature_stds(
     ],
     depends_on={"exp": EXP_FILES, "config": ROOT_DIR / "config.py"}
     | {
-        ("input", f): DATA_DIR / "sim_temperature_stds_results" / f"{f}.csv"
+        ("input", f): DATA_DIR / "sim_temperature_stds_results" / f"{f}"
         for f in FACTORS
     },
 ):
@@ -530,8 +525,8 @@ def task_plot_temperature_stds(
             df_input = _load_sim_data(depends_on["input", f])
             std = pd.concat(
                 [
-                    _reindex_in(df_input.in_profile_temperature.std()),
-                    _reindex_out(df_input.out_profile_temperature.std()),
+                    _reindex_in(df_input.in_profile_temperature.loc["std"]),
+                    _reindex_out(df_input.out_profile_temperature.loc["std"]),
                 ]
             ).sort_index()
 
@@ -551,7 +546,7 @@ def task_plot_filling_stds(
     ],
     depends_on={"exp": EXP_FILES}
     | {
-        ("input", f): DATA_DIR / "sim_diameter_stds_results" / f"{f}.csv"
+        ("input", f): DATA_DIR / "sim_diameter_stds_results" / f"{f}"
         for f in FACTORS
     },
 ):
@@ -567,7 +562,7 @@ def task_plot_filling_stds(
             color = mpl.colormaps["twilight"]((i + 1) / (len(FACTORS) + 1))
             ax.plot(
                 PASS_POSITIONS,
-                df_input.out_profile_filling_ratio.std().iloc[PASS_POSITIONS],
+                df_input.out_profile_filling_ratio.loc["std"].iloc[PASS_POSITIONS],
                 label=f"$\\StandardDeviation(\\Diameter) = \\num{{{f:.2f}}}\\,\\Expectation(\\Diameter)$",
                 c=color,
             )
@@ -579,8 +574,8 @@ def task_plot_roll_torque_std(
     produces=[
         IMG_DIR / f"plot_roll_torque_std.{suffix}" for suffix in ["png", "pdf", "svg"]
     ],
-    input=DATA_DIR / "sim_input_results.csv",
-    durations=DATA_DIR / "sim_durations_results.csv",
+    input=DATA_DIR / "sim_input_results",
+    durations=DATA_DIR / "sim_durations_results",
     exp=EXP_FILES,
     config=ROOT_DIR / "config.py",
 ):
@@ -597,14 +592,14 @@ def task_plot_roll_torque_std(
 
         ax.plot(
             PASS_POSITIONS,
-            df_input.roll_roll_torque.std() / 1e3,
+            df_input.roll_roll_torque.loc["std"] / 1e3,
             label="Only Varied Input",
             c=INPUT_COLOR,
         )
 
         ax.plot(
             PASS_POSITIONS,
-            df_durations.roll_roll_torque.std() / 1e3,
+            df_durations.roll_roll_torque.loc["std"] / 1e3,
             label="With Varied Durations",
             c=DURATIONS_COLOR,
         )
@@ -620,8 +615,8 @@ def task_plot_grain_size_std(
         produces=[
             IMG_DIR / f"plot_grain_size_std.{suffix}" for suffix in ["png", "pdf", "svg"]
         ],
-        input=DATA_DIR / "sim_input_results.csv",
-        durations=DATA_DIR / "sim_durations_results.csv",
+        input=DATA_DIR / "sim_input_results",
+        durations=DATA_DIR / "sim_durations_results",
         config=ROOT_DIR / "config.py",
 ):
     df_input = _load_sim_data(input)
@@ -636,16 +631,16 @@ def task_plot_grain_size_std(
 
         std1 = pd.concat(
             [
-                _reindex_in(df_input.in_profile_grain_size.std() * 1e6),
-                _reindex_out(df_input.out_profile_grain_size.std() * 1e6),
+                _reindex_in(df_input.in_profile_grain_size.loc["std"] * 1e6),
+                _reindex_out(df_input.out_profile_grain_size.loc["std"] * 1e6),
             ]
         ).sort_index()
         ax.plot(std1, label="Only Varied Input", c=INPUT_COLOR)
 
         std2 = pd.concat(
             [
-                _reindex_in(df_durations.in_profile_grain_size.std() * 1e6),
-                _reindex_out(df_durations.out_profile_grain_size.std() * 1e6),
+                _reindex_in(df_durations.in_profile_grain_size.loc["std"] * 1e6),
+                _reindex_out(df_durations.out_profile_grain_size.loc["std"] * 1e6),
             ]
         ).sort_index()
         ax.plot(std2, label="With Varied Durations", c=DURATIONS_COLOR)
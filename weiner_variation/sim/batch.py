@@ -0,0 +1,404 @@
+from contextlib import contextmanager
+from copy import deepcopy
+from dataclasses import dataclass, fields
+
+import numpy as np
+import pandas as pd
+import pyroll.basic as pr
+from pyroll.core import Config
+from pyroll.core.hooks import HookFunction
+from pyroll.integral_thermal.helper import mean_density, mean_specific_heat_capacity
+from pyroll.integral_thermal.transport import stefan_boltzmann_coefficient
+from pyroll.jmak_recrystallization import JMAKGrainGrowthParameters, JMAKRecrystallizationParameters
+from pyroll.jmak_recrystallization.config import Config as JMAKConfig
+
+from weiner_variation.sim.config import NEWTON_ITERATIONS
+from weiner_variation.sim.process import PASS_SEQUENCE
+
+
+@dataclass
+class TransportBatch:
+    """Thermal state and parameters of several transports, e.g. the same transport in several draws, as arrays.
+
+    Implements the convection, cooling and radiation model of ``pyroll.integral_thermal`` with the out-temperature
+    entering the mean temperature solved exactly by Newton's method instead of by the fixed-point iteration of the
+    units.
+    """
+
+    in_temperature: np.ndarray
+    area: np.ndarray
+    perimeter: np.ndarray
+    density: np.ndarray
+    specific_heat_capacity: np.ndarray
+    duration: np.ndarray
+    environment_temperature: np.ndarray
+    convection_heat_transfer_coefficient: np.ndarray
+    relative_radiation_coefficient: np.ndarray
+    cooling_heat_transfer_coefficient: np.ndarray
+    cooling_water_temperature: np.ndarray
+
+    @classmethod
+    def from_units(cls, transports: list[pr.Transport]) -> "TransportBatch":
+        """Gather the state of transports whose in-profiles are initialized, i.e. during or after solution."""
+
+        def gather(get):
+            return np.array([get(t) for t in transports], dtype=float)
+
+        # without cooling water, the cooling term vanishes by a zero coefficient
+        return cls(
+            in_temperature=gather(lambda t: t.in_profile.temperature),
+            area=gather(lambda t: t.in_profile.cross_section.area),
+            perimeter=gather(lambda t: t.in_profile.cross_section.length),
+            density=gather(mean_density),
+            specific_heat_capacity=gather(mean_specific_heat_capacity),
+            duration=gather(lambda t: t.duration),
+            environment_temperature=gather(lambda t: t.environment_temperature),
+            convection_heat_transfer_coefficient=gather(lambda t: t.convection_heat_transfer_coefficient),
+            relative_radiation_coefficient=gather(lambda t: t.relative_radiation_coefficient),
+            cooling_heat_transfer_coefficient=gather(
+                lambda t: t.cooling_heat_transfer_coefficient if t.has_value("cooling_water_temperature") else 0
+            ),
+            cooling_water_temperature=gather(
+                lambda t: t.cooling_water_temperature if t.has_value("cooling_water_temperature") else 0
+            ),
+        )
+
+    def temperature_changes(self, out_temperature: np.ndarray) -> dict[str, np.ndarray]:
+        """Temperature changes by mechanism for given out-temperatures."""
+        mean_temperature = (self.in_temperature + out_temperature) / 2
+        factor = -self.perimeter * self.duration / (self.area * self.density * self.specific_heat_capacity)
+
+        return {
+            "convection": factor
+            * self.convection_heat_transfer_coefficient
+            * (mean_temperature - self.environment_temperature),
+            "cooling": factor
+            * self.cooling_heat_transfer_coefficient
+            * (mean_temperature - self.cooling_water_temperature),
+            "radiation": factor
+            * self.relative_radiation_coefficient
+            * stefan_boltzmann_coefficient
+            * (mean_temperature**4 - self.environment_temperature**4),
+        }
+
+    def out_temperature(self, iterations: int = NEWTON_ITERATIONS) -> np.ndarray:
+        """Out-temperatures consistent with their own temperature changes."""
+        factor = -self.perimeter * self.duration / (self.area * self.density * self.specific_heat_capacity)
+        linear = factor * (self.convection_heat_transfer_coefficient + self.cooling_heat_transfer_coefficient)
+        quartic = factor * self.relative_radiation_coefficient * stefan_boltzmann_coefficient
+
+        temperature = self.in_temperature.copy()
+        for _ in range(iterations):
+            residual = temperature - self.in_temperature - sum(self.temperature_changes(temperature).values())
+            mean_temperature = (self.in_temperature + temperature) / 2
+            derivative = 1 - linear / 2 - 2 * quartic * mean_temperature**3
+            temperature = temperature - residual / derivative
+        return temperature
+
+
+def _vectorized_out_temperature(self: pr.Transport.OutProfile):
+    return TransportBatch.from_units([self.transport]).out_temperature()[0]
+
+
+_vectorized_function: HookFunction | None = None
+
+
+def set_vectorized_transports(enabled: bool) -> bool:
+    """Register or remove the vectorized out-temperature of transports, returning whether it was registered before."""
+    global _vectorized_function
+    was_enabled = _vectorized_function is not None
+
+    if enabled and not was_enabled:
+        _vectorized_function = pr.Transport.OutProfile.temperature.add_function(
+            _vectorized_out_temperature, tryfirst=True
+        )
+    elif not enabled and was_enabled:
+        pr.Transport.OutProfile.temperature.remove_function(_vectorized_function)
+        _vectorized_function = None
+
+    return was_enabled
+
+
+@contextmanager
+def vectorized_transports(enabled: bool = True):
+    """Solve transports with or without the vectorized out-temperature within the context."""
+    previous = set_vectorized_transports(enabled)
+    try:
+        yield
+    finally:
+        set_vectorized_transports(previous)
+
+
+def _parameter_arrays(parameter_sets: list, parameter_class: type) -> dict[str, np.ndarray]:
+    """Fields of parameter sets as arrays, sets not available (``None``) filled with NaN."""
+    return {
+        f.name: np.array([getattr(p, f.name) if p is not None else np.nan for p in parameter_sets], dtype=float)
+        for f in fields(parameter_class)
+    }
+
+
+def _profile_parameters(units: list[pr.Unit], name: str) -> list:
+    return [getattr(u.in_profile, name) if u.in_profile.has_value(name) else None for u in units]
+
+
+@dataclass
+class RecrystallizationBatch:
+    """Microstructure state of the same unit in several draws as arrays, for the models of
+    ``pyroll.jmak_recrystallization``.
+
+    ``strain_rate`` is the one of the unit for roll passes and of the preceding roll pass for transports,
+    ``temperature`` the mean of in- and out-temperature.
+    Parameter sets not available for a draw are NaN, and the mechanism falls back as in the scalar hooks.
+    """
+
+    in_strain: np.ndarray
+    in_recrystallized_fraction: np.ndarray
+    in_grain_size: np.ndarray
+    strain: np.ndarray
+    strain_rate: np.ndarray
+    temperature: np.ndarray
+    duration: np.ndarray
+    previous_dynamic: np.ndarray
+    dynamic_parameters: dict[str, np.ndarray]
+    metadynamic_parameters: dict[str, np.ndarray]
+    static_parameters: dict[str, np.ndarray]
+    grain_growth_parameters: dict[str, np.ndarray]
+
+    @classmethod
+    def from_units(cls, units: list[pr.Unit]) -> "RecrystallizationBatch":
+        """Gather the state of roll passes or transports whose in- and out-temperatures are known."""
+
+        def gather(get):
+            return np.array([get(u) for u in units], dtype=float)
+
+        def previous_dynamic(u):
+            try:
+                return u.prev.recrystallization_mechanism in ["dynamic", "metadynamic"]
+            except (IndexError, ValueError):
+                return False
+
+        is_roll_pass = isinstance(units[0], pr.RollPass)
+        return cls(
+            in_strain=gather(lambda u: u.in_profile.strain),
+            in_recrystallized_fraction=gather(lambda u: u.in_profile.recrystallized_fraction),
+            in_grain_size=gather(lambda u: u.in_profile.grain_size),
+            strain=gather(lambda u: u.strain) if is_roll_pass else np.zeros(len(units)),
+            strain_rate=gather(lambda u: u.strain_rate if is_roll_pass else u.prev_of(pr.RollPass).strain_rate),
+            temperature=gather(lambda u: (u.in_profile.temperature + u.out_profile.temperature) / 2),
+            duration=np.zeros(len(units)) if is_roll_pass else gather(lambda u: u.duration),
+            previous_dynamic=np.array([not is_roll_pass and previous_dynamic(u) for u in units]),
+            **{
+                f"{mechanism}_parameters": _parameter_arrays(
+                    _profile_parameters(units, f"jmak_{mechanism}_recrystallization_parameters"),
+                    JMAKRecrystallizationParameters,
+                )
+                for mechanism in ["dynamic", "metadynamic", "static"]
+            },
+            grain_growth_parameters=_parameter_arrays(
+                _profile_parameters(units, "jmak_grain_growth_parameters"), JMAKGrainGrowthParameters
+            ),
+        )
+
+    def _model_value(self, parameters: dict[str, np.ndarray], prefix: str) -> np.ndarray:
+        """Critical (``a``), reference (``b``) or recrystallized grain size (``c``) model value."""
+        return (
+            parameters[f"{prefix}1"]
+            * (self.in_strain + JMAKConfig.BASE_STRAIN) ** parameters[f"{prefix}2"]
+            * (self.strain_rate + JMAKConfig.BASE_STRAIN_RATE) ** parameters[f"{prefix}3"]
+            * (self.in_grain_size * 1e6) ** parameters[f"{prefix}4"]
+            * np.exp(parameters[f"q{prefix}"] / (Config.UNIVERSAL_GAS_CONSTANT * self.temperature))
+        )
+
+    def _grain_growth(self, grain_size: np.ndarray, duration: np.ndarray) -> np.ndarray:
+        parameters = self.grain_growth_parameters
+        grown = (
+            (grain_size * 1e6) ** parameters["d1"]
+            + parameters["d2"]
+            * duration
+            * np.exp(parameters["qd"] / (Config.UNIVERSAL_GAS_CONSTANT * self.temperature))
+        ) ** (1 / parameters["d1"]) / 1e6
+        return np.where(np.isnan(parameters["d1"]) | (duration < 0), grain_size, grown)
+
+    def roll_pass(self) -> dict[str, np.ndarray]:
+        """Dynamic recrystallization within roll passes."""
+        parameters = self.dynamic_parameters
+        critical = self._model_value(parameters, "a")
+        reference = self._model_value(parameters, "b")
+        total_strain = self.in_strain + self.strain
+
+        with np.errstate(all="ignore"):
+            fraction = 1 - np.exp(
+                parameters["k"] * ((total_strain - critical) / (reference - critical)) ** parameters["n"]
+            )
+            dynamic = total_strain > critical
+            fraction = np.where(dynamic & (critical <= reference) & np.isfinite(fraction) & (fraction > 0), fraction, 0)
+            grain_size = self.in_grain_size + (self._model_value(parameters, "c") / 1e6 - self.in_grain_size) * fraction
+            grain_size = np.where(np.isclose(grain_size, 0) | np.isnan(grain_size), self.in_grain_size, grain_size)
+
+        return {
+            "recrystallization_mechanism": np.where(dynamic, "dynamic", "none"),
+            "recrystallized_fraction": fraction,
+            "out_recrystallized_fraction": np.zeros_like(fraction),
+            "out_grain_size": grain_size,
+        }
+
+    def transport(self) -> dict[str, np.ndarray]:
+        """Static and metadynamic recrystallization and grain growth within transports."""
+        in_fraction = self.in_recrystallized_fraction
+        has_metadynamic = ~np.isnan(self.metadynamic_parameters["k"])
+        has_static = ~np.isnan(self.static_parameters["k"])
+        has_grain_growth = ~np.isnan(self.grain_growth_parameters["d1"])
+        full = in_fraction > 1 - JMAKConfig.THRESHOLD
+
+        mechanism = np.select(
+            [
+                self.previous_dynamic & has_metadynamic,
+                ~self.previous_dynamic & full & has_grain_growth,
+                ~self.previous_dynamic & full,
+                has_static,
+            ],
+            ["metadynamic", "grain_growth", "none", "static"],
+            "none",
+        )
+        metadynamic = mechanism == "metadynamic"
+        parameters = {
+            k: np.where(metadynamic, v, self.static_parameters[k]) for k, v in self.metadynamic_parameters.items()
+        }
+
+        critical = self._model_value(parameters, "a")
+        reference = self._model_value(parameters, "b")
+        k, n = parameters["k"], parameters["n"]
+
+        with np.errstate(all="ignore"):
+            virtual_time = (reference - critical) * (np.log(1 - in_fraction) / k) ** (1 / n) + critical
+            fraction = (
+                1 - np.exp(k * ((self.duration + virtual_time - critical) / (reference - critical)) ** n) - in_fraction
+            )
+            recrystallizing = np.isin(mechanism, ["static", "metadynamic"])
+            fraction = np.where(recrystallizing & (critical <= reference) & np.isfinite(fraction), fraction, 0)
+
+            finished_time = (np.log(JMAKConfig.THRESHOLD) / k) ** (1 / n) * reference
+            grown_in_grain_size = self._grain_growth(self.in_grain_size, self.duration)
+            grown_recrystallized_grain_size = self._grain_growth(
+                self._model_value(parameters, "c") / 1e6, self.duration - finished_time
+            )
+            grain_size = np.select(
+                [mechanism == "static", metadynamic, mechanism == "grain_growth"],
+                [
+                    fraction ** (4 / 3) * grown_recrystallized_grain_size + (1 - fraction) ** 2 * grown_in_grain_size,
+                    grown_in_grain_size + (grown_recrystallized_grain_size - grown_in_grain_size) * fraction,
+                    grown_in_grain_size,
+                ],
+                self.in_grain_size,
+            )
+
+        out_fraction = in_fraction + (1 - in_fraction) * fraction
+        return {
+            "recrystallization_mechanism": mechanism,
+            "recrystallized_fraction": fraction,
+            "out_recrystallized_fraction": out_fraction,
+            "out_grain_size": np.where(np.isclose(grain_size, 0), self.in_grain_size, grain_size),
+            "out_strain": np.where(out_fraction > 1 - JMAKConfig.THRESHOLD, 0, self.in_strain * (1 - fraction)),
+        }
+
+    def evaluate(self, is_roll_pass: bool) -> dict[str, np.ndarray]:
+        return self.roll_pass() if is_roll_pass else self.transport()
+
+
+def solve_scalar(in_profiles: list[pr.Profile], sequence: pr.PassSequence = PASS_SEQUENCE) -> list[pr.PassSequence]:
+    """Copies of the sequence solved for each in-profile by the scalar hooks of the plugins only."""
+    sequences = []
+    with vectorized_transports(False):
+        for in_profile in in_profiles:
+            s = deepcopy(sequence)
+            s.solve(in_profile)
+            sequences.append(s)
+    return sequences
+
+
+def check_transports(in_profiles: list[pr.Profile]) -> pd.DataFrame:
+    """Relative deviation of the batched out-temperatures and temperature changes from the scalar hooks.
+
+    The sequence is solved for each in-profile by ``solve_scalar`` and each transport is evaluated as one batch over
+    all of them.
+    """
+    sequences = solve_scalar(in_profiles)
+    deviations = {}
+    for i, unit in enumerate(sequences[0]):
+        if not isinstance(unit, pr.Transport):
+            continue
+
+        transports = [s[i] for s in sequences]
+        batch = TransportBatch.from_units(transports)
+        out_temperature = batch.out_temperature()
+        scalar_temperature = np.array([t.out_profile.temperature for t in transports])
+        scalar_change = np.array([t.temperature_change for t in transports])
+
+        deviations[i] = {
+            "out_temperature": np.max(np.abs(out_temperature / scalar_temperature - 1)),
+            "temperature_change": np.max(
+                np.abs(sum(batch.temperature_changes(out_temperature).values()) / scalar_change - 1)
+            ),
+        }
+
+    return pd.DataFrame(deviations).T
+
+
+# values below which deviations of the batched microstructure results are measured absolutely instead of relatively
+DEVIATION_SCALES = {
+    "recrystallized_fraction": 1,
+    "out_recrystallized_fraction": 1,
+    "out_grain_size": 1e-6,
+    "out_strain": JMAKConfig.BASE_STRAIN,
+}
+
+
+def check_recrystallization(sequences: list[pr.PassSequence]) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Deviation of the batched microstructure results from the solved scalar hooks, per unit and value.
+
+    Deviations are relative to the scalar value but at least to its scale in ``DEVIATION_SCALES``, so that fractions
+    are compared absolutely.
+    Draws where the batched mechanism or recrystallization state (none, partial or full by the fraction recrystallized
+    in the unit) differs from the scalar one, as happens where critical and reference value of the models nearly
+    coincide, are left out of the deviations and listed in the second frame by unit and draw instead.
+    """
+
+    def state(fraction):
+        return np.select(
+            [fraction > 1 - JMAKConfig.THRESHOLD, fraction > JMAKConfig.THRESHOLD], ["full", "partial"], "none"
+        )
+
+    deviations = {}
+    mismatches = []
+    for i, unit in enumerate(sequences[0]):
+        units = [s[i] for s in sequences]
+        results = RecrystallizationBatch.from_units(units).evaluate(isinstance(unit, pr.RollPass))
+
+        batched = {
+            "mechanism": results.pop("recrystallization_mechanism"),
+            "fraction": results["recrystallized_fraction"],
+        }
+        scalar = {
+            "mechanism": np.array([u.recrystallization_mechanism for u in units]),
+            "fraction": np.array([u.recrystallized_fraction for u in units]),
+        }
+        matching = (batched["mechanism"] == scalar["mechanism"]) & (
+            state(batched["fraction"]) == state(scalar["fraction"])
+        )
+        mismatches += [
+            {"unit": i, "draw": draw}
+            | {f"scalar_{k}": v[draw] for k, v in scalar.items()}
+            | {f"batched_{k}": v[draw] for k, v in batched.items()}
+            for draw in np.flatnonzero(~matching)
+        ]
+
+        deviations[i] = {}
+        for name, values in results.items():
+            scalar = np.array(
+                [getattr(u.out_profile if name.startswith("out_") else u, name.removeprefix("out_")) for u in units]
+            )
+            deviation = np.abs(values - scalar) / np.maximum(np.abs(scalar), DEVIATION_SCALES[name])
+            deviations[i][name] = np.max(deviation[matching], initial=0)
+
+    columns = ["unit", "draw", "scalar_mechanism", "scalar_fraction", "batched_mechanism", "batched_fraction"]
+    return pd.DataFrame(deviations).T, pd.DataFrame(mismatches, columns=columns)
@@ -0,0 +1,132 @@
+from copy import deepcopy
+from timeit import default_timer as timer
+
+import pandas as pd
+import pyroll.basic as pr
+
+from weiner_variation.sim.batch import (
+    RecrystallizationBatch,
+    TransportBatch,
+    set_vectorized_transports,
+    vectorized_transports,
+)
+from weiner_variation.sim.config import CONVERGENCE_PROPERTIES, VECTORIZED_TRANSPORTS
+from weiner_variation.sim.data import DrawInput, DrawParameters
+from weiner_variation.sim.process import DIAMETER, DIAMETER_STD, PASS_SEQUENCE, TEMPERATURE, create_in_profile
+from weiner_variation.sim.runner import SequenceTemplate, init_worker, solve_draw
+
+
+def _time(func, repeat):
+    start = timer()
+    for _ in range(repeat):
+        func()
+    return (timer() - start) / repeat
+
+
+def benchmark_draw_overhead(repeat: int = 100) -> pd.Series:
+    draw = DrawInput(DIAMETER, TEMPERATURE)
+    set_vectorized_transports(VECTORIZED_TRANSPORTS)
+
+    def setup_deepcopy():
+        create_in_profile(draw.diameter)
+        return deepcopy(PASS_SEQUENCE)
+
+    template = SequenceTemplate(PASS_SEQUENCE)
+    template.reset().solve(create_in_profile(draw.diameter))
+
+    def setup_template():
+        create_in_profile(draw.diameter)
+        return template.reset()
+
+    def solve():
+        template.reset().solve(create_in_profile(draw.diameter))
+
+    warm_template = SequenceTemplate(PASS_SEQUENCE, warm_start=True)
+
+    def solve_perturbed(t):
+        t.reset().solve(create_in_profile(draw.diameter + DIAMETER_STD))
+
+    sequence = template.reset()
+    sequence.solve(create_in_profile(draw.diameter))
+    transports = [u for u in sequence if isinstance(u, pr.Transport)]
+
+    def solve_transports_scalar():
+        with vectorized_transports(False):
+            for t in transports:
+                t.solve(t.in_profile)
+
+    # the code path of the runner: whole draws with the transport hook swapped per unit
+    def solve_perturbed_transports(enabled):
+        with vectorized_transports(enabled):
+            solve_perturbed(template)
+
+    draw_count = 100
+
+    def solve_transports_batched():
+        for t in transports:
+            TransportBatch.from_units([t] * draw_count).out_temperature()
+
+    recrystallization_batches = [
+        (RecrystallizationBatch.from_units([u] * draw_count), isinstance(u, pr.RollPass)) for u in sequence
+    ]
+
+    def solve_recrystallization_batched():
+        for b, is_roll_pass in recrystallization_batches:
+            b.evaluate(is_roll_pass)
+
+    return pd.Series(
+        {
+            "worker_init": _time(init_worker, 1),
+            "setup_deepcopy": _time(setup_deepcopy, repeat),
+            "setup_template": _time(setup_template, repeat),
+            "solve": _time(solve, max(repeat // 20, 1)),
+            "solve_cold_start": _time(lambda: solve_perturbed(template), max(repeat // 20, 1)),
+            "solve_warm_start": _time(lambda: solve_perturbed(warm_template), max(repeat // 20, 1)),
+            "solve_scalar_transports": _time(lambda: solve_perturbed_transports(False), max(repeat // 20, 1)),
+            "solve_vectorized_transports": _time(lambda: solve_perturbed_transports(True), max(repeat // 20, 1)),
+            "transports_scalar": _time(solve_transports_scalar, repeat),
+            "transports_batched": _time(solve_transports_batched, repeat) / draw_count,
+            "recrystallization_batched": _time(solve_recrystallization_batched, repeat) / draw_count,
+        },
+        name="seconds",
+    )
+
+
+def check_predecessor_independence(
+    draw: DrawInput | None = None,
+    predecessors: list[DrawInput] | None = None,
+) -> bool:
+    """Whether a draw gives identical results when solved by the same worker after each of the predecessors."""
+    if draw is None:
+        draw = DrawParameters(DIAMETER, TEMPERATURE, {"CONTACT_HEAT_TRANSFER": 5000, "F2.gap": 1.6e-3})
+    if predecessors is None:
+        predecessors = [
+            DrawParameters(DIAMETER, TEMPERATURE, {"CONTACT_HEAT_TRANSFER": 5000}),
+            DrawInput(DIAMETER + DIAMETER_STD, TEMPERATURE),
+        ]
+
+    init_worker()
+    results = []
+    for predecessor in predecessors:
+        solve_draw(predecessor, CONVERGENCE_PROPERTIES)
+        results.append(solve_draw(draw, CONVERGENCE_PROPERTIES).astype(float))
+    return all(r.equals(results[0]) for r in results[1:])
+
+
+if __name__ == "__main__":
+    result = benchmark_draw_overhead()
+    print(result.to_string())
+    print(f"per-draw setup speedup: {result.setup_deepcopy / result.setup_template:.1f}x")
+    print(f"setup share of draw before: {result.setup_deepcopy / (result.solve + result.setup_deepcopy):.2%}")
+    print(f"setup share of draw after: {result.setup_template / (result.solve + result.setup_template):.2%}")
+    print(f"warm start speedup: {result.solve_cold_start / result.solve_warm_start:.2f}x")
+    print(
+        "vectorized transport speedup of a draw: "
+        f"{result.solve_scalar_transports / result.solve_vectorized_transports:.2f}x"
+    )
+    # the runner solves each draw on its own, batches over draws are not used by any scenario
+    print(
+        "transport speedup batched over draws (not used by the runner): "
+        f"{result.transports_scalar / result.transports_batched:.1f}x"
+    )
+    print(f"draw results independent of the predecessor: {check_predecessor_independence()}")
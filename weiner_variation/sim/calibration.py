@@ -0,0 +1,89 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyroll.core as pr
+from scipy.optimize import minimize
+from scipy.stats import wasserstein_distance
+
+from weiner_variation.data.measurements import filter_temperatures
+from weiner_variation.sim.config import CALIBRATION_DRAWS, SEED
+from weiner_variation.sim.data import DrawInput
+from weiner_variation.sim.process import PASS_SEQUENCE
+from weiner_variation.sim.surrogate import Surrogate
+
+PASS_UNITS = {u.label: str(i) for i, u in enumerate(PASS_SEQUENCE) if isinstance(u, pr.RollPass)}
+
+# measured quantity: (simulated property, factor from simulated to measured units, offset)
+MEASURED_QUANTITIES = {
+    "roll_force": ("roll_force", 1e-3, 0),
+    "roll_torque": ("roll_roll_torque", 2e-3, 0),
+    "in_temperature": ("in_profile_temperature", 1, -273.15),
+    "out_temperature": ("out_profile_temperature", 1, -273.15),
+}
+
+# calibrated (property, statistic) of the input distribution and their scale in the optimizer
+PARAMETERS = {("temperature", "mean"): 1, ("temperature", "std"): 1, ("diameter", "std"): 1e-3}
+
+
+def load_measurements(files: list[Path]) -> pd.DataFrame:
+    """Measured pass data of all files, with columns ``(quantity, pass label)`` and temperatures filtered as in the
+    figures."""
+    def _load_file(file):
+        df = pd.read_csv(file, index_col=0, header=0)[list(MEASURED_QUANTITIES)]
+        return df.stack(dropna=False).swaplevel()
+
+    df = pd.concat([_load_file(f) for f in files], axis=1).T.reset_index(drop=True)
+    for quantity in ["in_temperature", "out_temperature"]:
+        df[quantity] = filter_temperatures(df[quantity])
+    return df
+
+
+def distance(simulated: pd.DataFrame, measured: pd.DataFrame) -> float:
+    """Sum of the Wasserstein distances of all measured per-pass quantities, relative to their measured spread."""
+    total = 0
+    for (quantity, label), values in measured.items():
+        values = values.dropna().to_numpy()
+        if len(values) < 2 or values.std() == 0:
+            continue
+
+        prop, factor, offset = MEASURED_QUANTITIES[quantity]
+        sim = simulated[prop, PASS_UNITS[label]].to_numpy() * factor + offset
+        total += wasserstein_distance(sim, values) / values.std()
+    return total
+
+
+def calibrate(
+    surrogate: Surrogate,
+    measured: pd.DataFrame,
+    input_dist: pd.DataFrame,
+    draw_count: int = CALIBRATION_DRAWS,
+) -> tuple[pd.DataFrame, float]:
+    """Input distribution minimising the distance between surrogate predictions and measurements.
+
+    ``input_dist`` is indexed by property with columns ``mean`` and ``std`` and gives the starting point.
+    All candidates are evaluated on the same standard-normal draws (common random numbers),
+    so that the objective is deterministic in the parameters.
+    Returns the calibrated distribution in the same format and the reached distance.
+    """
+    z = np.random.default_rng(SEED).standard_normal((draw_count, 2))
+    scales = np.array(list(PARAMETERS.values()))
+
+    def distribution(x):
+        dist = input_dist.copy()
+        for (prop, stat), value in zip(PARAMETERS, x * scales, strict=True):
+            dist.loc[prop, stat] = value
+        return dist
+
+    def objective(x):
+        dist = distribution(x)
+        diameters = dist.loc["diameter", "mean"] + dist.loc["diameter", "std"] * z[:, 0]
+        temperatures = dist.loc["temperature", "mean"] + dist.loc["temperature", "std"] * z[:, 1]
+        draws = [DrawInput(d, t) for d, t in zip(diameters, temperatures, strict=True)]
+        return distance(surrogate.predict(draws), measured)
+
+    x0 = np.array([input_dist.loc[p] for p in PARAMETERS]) / scales
+    bounds = [(None, None) if stat == "mean" else (0, None) for _, stat in PARAMETERS]
+    result = minimize(objective, x0, method="Powell", bounds=bounds)
+
+    return distribution(result.x), result.fun
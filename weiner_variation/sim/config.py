@@ -2,8 +2,83 @@ SAMPLE_COUNT = 1000
 
 SEED = 38945729345645209345
 
+PROCESSES = None
+CHUNK_SIZE = 1
+BATCH_SIZE = 100
+SHARED_BUFFER_SIZE = 1000
+STORE_RAW = True
+# start the iterations of every unit from the nominal solution
+WARM_START = True
+# solve the implicit transport temperature equation exactly instead of by the iteration of the units
+VECTORIZED_TRANSPORTS = True
+NEWTON_ITERATIONS = 4
+
+TARGET_PRECISION = None
+BLOCK_SIZE = 50
+# the precision of the std relies on the sample kurtosis, which is bounded near 1 for few draws
+MIN_ADAPTIVE_SAMPLE_COUNT = 30
+CONFIDENCE = 0.95
+MONITORED_PROPERTIES = [
+    "roll_force",
+    "roll_roll_torque",
+    "out_profile_temperature",
+    "out_profile_grain_size",
+]
+
+OUTPUTS = [
+    "roll_force",
+    "roll_roll_torque",
+    "in_profile_temperature",
+    "out_profile_temperature",
+    "in_profile_grain_size",
+    "out_profile_grain_size",
+    "out_profile_filling_ratio",
+    "temperature_change",
+    "temperature_change_by_deformation",
+]
+
 SIMS = ["nominal", "input", "durations"]
 SIMS_STDS = ["temperature", "diameter"]
+FACTORS = [0.01, 0.02, 0.05]
+
+CONVERGENCE_SAMPLE_COUNT = 256
+CONVERGENCE_SAMPLE_SIZES = [8, 16, 32, 64, 128, 256]
+# replicates of every sampler and sample size, whose spread is the reported error of the estimates
+CONVERGENCE_REPLICATES = 8
+CONVERGENCE_PROPERTIES = [
+    "roll_force",
+    "roll_roll_torque",
+    "out_profile_temperature",
+    "out_profile_grain_size",
+    "out_profile_filling_ratio",
+]
+
+SENSITIVITY_SAMPLE_COUNT = 256
+SENSITIVITY_BOOTSTRAP_COUNT = 200
+SENSITIVITY_PROPERTIES = ["roll_force", "out_profile_temperature", "out_profile_grain_size"]
+
+LINEARIZATION_STEP = 0.5
+
+SURROGATE_DEGREE = 2
+SURROGATE_VALIDATION_FRACTION = 0.2
+
+CALIBRATION_SAMPLE_COUNT = 200
+CALIBRATION_TEMPERATURE_STD = 30
+CALIBRATION_DRAWS = 2000
+
+IMPORTANCE_SAMPLE_COUNT = 200
+
+# rare events as (property, unit index, threshold) exceeded by the column
+TAIL_EVENTS = {
+    "overfilling_R1": ("out_profile_filling_ratio", "0", 1),
+    "overload_R1": ("roll_force", "0", 300e3),
+}
+
+MULTILEVEL_COARSE_SAMPLE_COUNT = 1000
+MULTILEVEL_FINE_SAMPLE_COUNT = 100
+# solver settings of the coarse level, the sequence is solved in a single sweep over its units
+# (a maximum iteration count of 2, pyroll's warning on reaching it is suppressed by the runner)
+COARSE_FIDELITY = {"ITERATION_PRECISION": 0.05, "SEQUENCE_MAX_ITERATION_COUNT": 2}
 
 from papermill.translators import (
     PythonTranslator,
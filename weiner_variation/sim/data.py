@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 import numpy as np
 
@@ -12,3 +12,9 @@ class DrawInput:
 @dataclass
 class DrawDurations(DrawInput):
     durations: np.ndarray
+
+
+@dataclass
+class DrawParameters(DrawInput):
+    parameters: dict[str, float] = field(default_factory=dict)
+    durations: np.ndarray | None = None
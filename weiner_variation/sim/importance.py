@@ -0,0 +1,94 @@
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from scipy.stats import norm
+
+from weiner_variation.sim.config import CONFIDENCE, IMPORTANCE_SAMPLE_COUNT, SEED
+from weiner_variation.sim.data import DrawInput
+from weiner_variation.sim.runner import Design, Scenario, run
+from weiner_variation.sim.sampling import sample_uniforms
+from weiner_variation.sim.store import ResultStore
+
+
+@dataclass
+class ImportanceDesign(Design):
+    """Draws of a base scenario with the standard-normal coordinates of its inputs shifted by ``shift``.
+
+    Coordinates are those of the uniform draws mapped through the standard-normal quantile function, so that the
+    likelihood ratio of base and shifted density is exact for all inputs.
+    """
+
+    name: str
+    base: Scenario
+    shift: list[float]
+    sample_count: int = IMPORTANCE_SAMPLE_COUNT
+    seed: int = SEED
+
+    def normals(self, indices: np.ndarray) -> np.ndarray:
+        u = sample_uniforms(self.base.sampler, self.seed, self.base.dimension, indices, self.sample_count)
+        return norm.ppf(u) + np.asarray(self.shift)
+
+    def weights(self, indices: np.ndarray) -> np.ndarray:
+        """Likelihood ratios of the base to the shifted density of the given draws."""
+        shift = np.asarray(self.shift)
+        return np.exp(-self.normals(indices) @ shift + shift @ shift / 2)
+
+    def transform(self, indices: np.ndarray) -> list[DrawInput]:
+        return self.base.transform(norm.cdf(self.normals(indices)))
+
+
+def design_point(linear: pd.DataFrame, column: tuple[str, str], threshold: float) -> list[float]:
+    """Most probable point of ``column > threshold`` in standard-normal coordinates under a linear propagation.
+
+    ``linear`` is the result of ``linearization.propagate`` for the base scenario.
+    """
+    mean = linear.loc["mean"].iloc[0][column]
+    contributions = linear.loc["contribution"][column].to_numpy()
+    norm_squared = contributions @ contributions
+
+    if norm_squared == 0:
+        raise ValueError(f"Column {column} does not depend on the inputs in the linear propagation.")
+
+    return list((threshold - mean) * contributions / norm_squared)
+
+
+def run_importance(design: ImportanceDesign, output_dir: Path, **kwargs) -> ResultStore:
+    store = run(design, output_dir, **kwargs)
+    store.write_meta(shift=list(design.shift))
+    return store
+
+
+def tail_probability(
+    df: pd.DataFrame,
+    design: ImportanceDesign,
+    column: tuple[str, str],
+    threshold: float,
+    confidence: float = CONFIDENCE,
+) -> pd.Series:
+    """Weighted estimate of the probability of ``column > threshold`` under the base scenario.
+
+    The confidence interval uses the normal approximation of the estimator.
+    ``equivalent_sample_count`` is the number of plain Monte-Carlo draws giving the same standard error.
+    """
+    weights = design.weights(df.index.to_numpy())
+    values = weights * (df[column].to_numpy() > threshold)
+    n = len(values)
+
+    probability = values.mean()
+    std_error = values.std(ddof=1) / np.sqrt(n)
+    half_width = norm.ppf((1 + confidence) / 2) * std_error
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return pd.Series(
+            {
+                "probability": probability,
+                "std_error": std_error,
+                "low": max(probability - half_width, 0),
+                "high": probability + half_width,
+                "effective_sample_size": weights.sum() ** 2 / (weights**2).sum(),
+                "equivalent_sample_count": probability * (1 - probability) / std_error**2,
+                "sample_count": n,
+            }
+        )
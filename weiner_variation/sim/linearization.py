@@ -0,0 +1,73 @@
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from weiner_variation.sim.config import LINEARIZATION_STEP
+from weiner_variation.sim.data import DrawInput
+from weiner_variation.sim.runner import Design, Scenario
+
+
+@dataclass
+class LinearizationDesign(Design):
+    """Nominal point and central finite-difference steps of each uncertain input of a base scenario.
+
+    Inputs are perturbed by ``step`` standard deviations around their means, draw 0 being the nominal point and
+    draws ``2 * i + 1`` and ``2 * i + 2`` the positive and negative steps of input ``i``.
+    """
+
+    name: str
+    base: Scenario
+    step: float = LINEARIZATION_STEP
+
+    @property
+    def sample_count(self) -> int:
+        return 1 + 2 * self.base.dimension
+
+    def transform(self, indices: np.ndarray) -> list[DrawInput]:
+        z = np.zeros((len(indices), self.base.dimension))
+        perturbed = np.flatnonzero(indices > 0)
+        inputs, signs = np.divmod(indices[perturbed] - 1, 2)
+        z[perturbed, inputs] = np.where(signs == 0, self.step, -self.step)
+
+        return self.base.transform(self.base.standardized_uniforms(z))
+
+
+def propagate(df: pd.DataFrame, design: LinearizationDesign) -> pd.DataFrame:
+    """First-order mean and standard deviation of all result columns from the solved design.
+
+    The contributions of the independent inputs to the standard deviation are the central differences per
+    standard deviation of the input.
+    """
+    if not np.array_equal(df.index, np.arange(design.sample_count)):
+        raise ValueError("Linear propagation requires the results of all draws of the design.")
+
+    values = df.to_numpy()
+    contributions = (values[1::2] - values[2::2]) / (2 * design.step)
+
+    return pd.concat(
+        {
+            "mean": pd.DataFrame([values[0]], index=["nominal"], columns=df.columns),
+            "contribution": pd.DataFrame(contributions, index=design.base.input_names, columns=df.columns),
+            "std": pd.DataFrame([np.sqrt((contributions**2).sum(axis=0))], index=["total"], columns=df.columns),
+        }
+    )
+
+
+def compare(linear: pd.DataFrame, summary: pd.DataFrame) -> pd.DataFrame:
+    """Mean and standard deviation of the linear propagation next to a Monte-Carlo summary of the same scenario."""
+    mean = linear.loc["mean"].iloc[0]
+    std = linear.loc["std"].iloc[0]
+    mc_mean = summary.loc["mean", mean.index]
+    mc_std = summary.loc["std", std.index]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return pd.DataFrame(
+            {
+                "mean_linear": mean,
+                "mean_mc": mc_mean,
+                "std_linear": std,
+                "std_mc": mc_std,
+                "std_relative_error": std / mc_std - 1,
+            }
+        )
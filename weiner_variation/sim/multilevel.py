@@ -0,0 +1,79 @@
+from dataclasses import dataclass, field, replace
+
+import numpy as np
+import pandas as pd
+
+from weiner_variation.sim.config import (
+    COARSE_FIDELITY,
+    MULTILEVEL_COARSE_SAMPLE_COUNT,
+    MULTILEVEL_FINE_SAMPLE_COUNT,
+)
+from weiner_variation.sim.data import DrawInput, DrawParameters
+from weiner_variation.sim.runner import Design, Scenario
+
+
+@dataclass
+class MultilevelDesign(Design):
+    """Two-level design of a base scenario, solved by the runner as a single scenario.
+
+    Draws ``0 .. coarse_sample_count - 1`` solve the base draws of the same index at the coarse fidelity, followed by
+    the fine and then the coarse solutions of the next ``fine_sample_count`` base draws, so that both levels are
+    independent and each pair of the correction shares its input draw.
+    """
+
+    name: str
+    base: Scenario
+    coarse_sample_count: int = MULTILEVEL_COARSE_SAMPLE_COUNT
+    fine_sample_count: int = MULTILEVEL_FINE_SAMPLE_COUNT
+    coarse_fidelity: dict[str, float] = field(default_factory=lambda: dict(COARSE_FIDELITY))
+
+    @property
+    def sample_count(self) -> int:
+        return self.coarse_sample_count + 2 * self.fine_sample_count
+
+    def transform(self, indices: np.ndarray) -> list[DrawInput]:
+        pair_start = self.coarse_sample_count + self.fine_sample_count
+        fine = (indices >= self.coarse_sample_count) & (indices < pair_start)
+        base_indices = np.where(indices >= pair_start, indices - self.fine_sample_count, indices)
+
+        base = replace(self.base, sample_count=self.coarse_sample_count + self.fine_sample_count)
+        return [
+            draw
+            if is_fine
+            else DrawParameters(
+                draw.diameter, draw.temperature, dict(self.coarse_fidelity), getattr(draw, "durations", None)
+            )
+            for draw, is_fine in zip(base.draws(base_indices), fine, strict=True)
+        ]
+
+
+def estimate(df: pd.DataFrame, design: MultilevelDesign) -> pd.DataFrame:
+    """Multilevel estimates of mean and standard deviation of all result columns.
+
+    Both are the coarse estimates plus the mean fine-coarse difference of the first and second moments, the standard
+    deviation is the square root of second moment minus squared mean and thus the biased (1/N) estimate.
+    ``mean_std_error`` is the standard error of the mean, ``correction_std`` the standard deviation of the pair
+    differences, which determines how few fine draws suffice.
+    """
+    if not np.array_equal(df.index, np.arange(design.sample_count)):
+        raise ValueError("Multilevel estimates require the results of all draws of the design.")
+
+    values = df.to_numpy()
+    n_coarse, n_fine = design.coarse_sample_count, design.fine_sample_count
+    coarse = values[:n_coarse]
+    fine = values[n_coarse : n_coarse + n_fine]
+    coupled = values[n_coarse + n_fine :]
+
+    mean = coarse.mean(axis=0) + (fine - coupled).mean(axis=0)
+    second_moment = (coarse**2).mean(axis=0) + (fine**2 - coupled**2).mean(axis=0)
+
+    return pd.DataFrame(
+        [
+            mean,
+            np.sqrt(np.maximum(second_moment - mean**2, 0)),
+            np.sqrt(coarse.var(axis=0, ddof=1) / n_coarse + (fine - coupled).var(axis=0, ddof=1) / n_fine),
+            (fine - coupled).std(axis=0, ddof=1),
+        ],
+        index=["mean", "std", "mean_std_error", "correction_std"],
+        columns=df.columns,
+    )
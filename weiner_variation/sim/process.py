@@ -9,6 +9,22 @@ DIAMETER_STD = 1e-3
 TEMPERATURE_STD = 10
 
 
+FLOW_STRESS_COEFFICIENTS = FreibergFlowStressCoefficients(
+    a=2098.29 * 1e6,
+    m1=-0.00272,
+    m2=0.22312,
+    m3=0,
+    m4=-0.00003,
+    m5=0.00028,
+    m6=0,
+    m7=-0.58508,
+    m8=0.000137,
+    m9=0,
+    baseStrain=0.1,
+    baseStrainRate=0.1,
+)
+
+
 def create_in_profile(diameter):
     return pr.Profile.round(
         diameter=diameter,
@@ -17,20 +33,7 @@ def create_in_profile(diameter):
         specific_heat_capacity=690,
         material=["C15", "C-Mn", "steel"],
         strain=0,
-        freiberg_flow_stress_coefficients=FreibergFlowStressCoefficients(
-            a=2098.29 * 1e6,
-            m1=-0.00272,
-            m2=0.22312,
-            m3=0,
-            m4=-0.00003,
-            m5=0.00028,
-            m6=0,
-            m7=-0.58508,
-            m8=0.000137,
-            m9=0,
-            baseStrain=0.1,
-            baseStrainRate=0.1,
-        ),
+        freiberg_flow_stress_coefficients=FLOW_STRESS_COEFFICIENTS,
         recrystallized_fraction=0,
         grain_size=50e-6,
     )
@@ -219,3 +222,50 @@ for u in PASS_SEQUENCE:
     if isinstance(u, pr.Transport):
         u.convection_heat_transfer_coefficient = CONVECTION_HEAT_TRANSFER
         u.relative_radiation_coefficient = RELATIVE_RADIATION
+
+
+REVERSING_TRANSPORTS = slice(0, 9)
+LAST_REVERSING_TRANSPORT = 9
+
+
+def set_parameter(sequence: pr.PassSequence, name: str, value: float):
+    """Set a process parameter given by the name of its constant above or as ``<pass label or unit index>.<attribute>``.
+
+    The solver settings ``ITERATION_PRECISION`` (of the sequence and all units) and ``SEQUENCE_MAX_ITERATION_COUNT``
+    are accepted as well.
+    """
+    if name == "CONTACT_HEAT_TRANSFER":
+        for u in sequence.roll_passes:
+            u.roll.contact_heat_transfer_coefficient = value
+    elif name == "ROLL_TEMPERATURE":
+        for u in sequence.roll_passes:
+            u.roll.temperature = value
+    elif name == "CONVECTION_HEAT_TRANSFER":
+        for u in sequence.transports:
+            u.convection_heat_transfer_coefficient = value
+    elif name == "RELATIVE_RADIATION":
+        for u in sequence.transports:
+            u.relative_radiation_coefficient = value
+    elif name == "REVERSING_PAUSE_DURATION":
+        for u in sequence.transports[REVERSING_TRANSPORTS]:
+            u.duration = value
+    elif name == "LAST_REVERSING_PAUSE_DURATION":
+        sequence.transports[LAST_REVERSING_TRANSPORT].duration = value
+    elif name == "ITERATION_PRECISION":
+        for u in [sequence, *sequence]:
+            u.iteration_precision = value
+    elif name == "SEQUENCE_MAX_ITERATION_COUNT":
+        sequence.max_iteration_count = int(value)
+    else:
+        unit_key, _, path = name.partition(".")
+        if unit_key.isdigit():
+            unit = sequence[int(unit_key)]
+        else:
+            unit = next((u for u in sequence if u.label == unit_key), None)
+
+        attributes = path.split(".")
+        if unit is None or not path or len(attributes) > 2 or (len(attributes) == 2 and attributes[0] != "roll"):
+            raise ValueError(f"Unknown process parameter '{name}'.")
+
+        host = unit.roll if len(attributes) == 2 else unit
+        setattr(host, attributes[-1], value)
@@ -0,0 +1,778 @@
+import hashlib
+import inspect
+import itertools
+import json
+import logging
+import queue
+import secrets
+from contextlib import contextmanager
+from copy import deepcopy
+from dataclasses import asdict, dataclass, fields, replace
+from functools import cache, partial
+from multiprocessing import Pool, resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyroll.basic as pr
+import pyroll.export as pre
+import tqdm
+from pyroll.core.hooks import root_hooks
+from scipy.stats import norm, weibull_min
+
+from weiner_variation.config import DATA_DIR, SIM_DIR
+from weiner_variation.sim.batch import set_vectorized_transports
+from weiner_variation.sim.config import (
+    BATCH_SIZE,
+    BLOCK_SIZE,
+    CHUNK_SIZE,
+    CONFIDENCE,
+    MIN_ADAPTIVE_SAMPLE_COUNT,
+    MONITORED_PROPERTIES,
+    NEWTON_ITERATIONS,
+    PROCESSES,
+    SAMPLE_COUNT,
+    SEED,
+    SHARED_BUFFER_SIZE,
+    STORE_RAW,
+    TARGET_PRECISION,
+    VECTORIZED_TRANSPORTS,
+    WARM_START,
+)
+from weiner_variation.sim.data import DrawDurations, DrawInput, DrawParameters
+from weiner_variation.sim.process import (
+    DIAMETER,
+    DIAMETER_STD,
+    PASS_SEQUENCE,
+    TEMPERATURE,
+    TEMPERATURE_STD,
+    create_in_profile,
+    set_parameter,
+)
+from weiner_variation.sim.sampling import SAMPLERS, sample_uniforms
+from weiner_variation.sim.statistics import relative_precision
+from weiner_variation.sim.store import ResultStore, load_columns, to_values
+
+DURATIONS_DIST_FILE = DATA_DIR / "duo_pauses_dist.csv"
+# code and settings determining the solution of a draw, part of every scenario hash
+SOLVER_FILES = [SIM_DIR / "process.py", SIM_DIR / "batch.py"]
+SOLVER_SETTINGS = {
+    "WARM_START": WARM_START,
+    "VECTORIZED_TRANSPORTS": VECTORIZED_TRANSPORTS,
+    "NEWTON_ITERATIONS": NEWTON_ITERATIONS,
+}
+# code determining the inputs of each draw index besides ``Scenario`` itself, part of every scenario hash
+DRAW_FILES = [
+    SIM_DIR / "sampling.py",
+    SIM_DIR / "sweep.py",
+    SIM_DIR / "sensitivity.py",
+    SIM_DIR / "linearization.py",
+    SIM_DIR / "importance.py",
+    SIM_DIR / "multilevel.py",
+]
+
+
+@dataclass
+class Scenario:
+    name: str
+    diameter_std: float = DIAMETER_STD
+    temperature_std: float = TEMPERATURE_STD
+    vary_durations: bool = False
+    sample_count: int = SAMPLE_COUNT
+    seed: int = SEED
+    sampler: str = "mc"
+    outputs: list[str] | None = None
+
+    @property
+    def hash(self) -> str:
+        fields = asdict(self)
+        del fields["name"]
+        if self.sampler != "lhs":  # latin hypercube strata depend on the sample count
+            del fields["sample_count"]
+
+        h = hashlib.sha256(json.dumps(fields, sort_keys=True).encode())
+        h.update(json.dumps(SOLVER_SETTINGS, sort_keys=True).encode())
+        for file in SOLVER_FILES + DRAW_FILES:
+            h.update(file.read_bytes())
+        h.update(inspect.getsource(Scenario).encode())
+        if self.vary_durations:
+            h.update(DURATIONS_DIST_FILE.read_bytes())
+        return h.hexdigest()
+
+    @property
+    def dimension(self) -> int:
+        if self.vary_durations:
+            return 2 + len(_durations_dists())
+        return 2
+
+    def uniforms(self, indices: np.ndarray) -> np.ndarray:
+        return sample_uniforms(self.sampler, self.seed, self.dimension, indices, self.sample_count)
+
+    @property
+    def input_names(self) -> list[str]:
+        if self.vary_durations:
+            return ["diameter", "temperature", *_durations_dists().index]
+        return ["diameter", "temperature"]
+
+    def normals(self, indices: np.ndarray, u: np.ndarray | None = None) -> np.ndarray:
+        """Standard-normal base draws of diameter and temperature.
+
+        They depend only on seed, sampler and draw index, so scenarios differing only in their standard deviations
+        scale the same base draws (common random numbers).
+        """
+        if u is None:
+            u = self.uniforms(indices)
+        return norm.ppf(u[:, :2])
+
+    def draws(self, indices: np.ndarray | None = None) -> list[DrawInput]:
+        if indices is None:
+            indices = np.arange(self.sample_count)
+
+        return self.transform(self.uniforms(indices))
+
+    def standardized_uniforms(self, z: np.ndarray) -> np.ndarray:
+        """Uniform draws placing each input ``z`` of its standard deviations away from its mean."""
+        u = norm.cdf(z)
+        if self.vary_durations:
+            for i, d in enumerate(_durations_dists().values):
+                u[:, 2 + i] = d.cdf(d.mean() + z[:, 2 + i] * d.std())
+        return u
+
+    def normalize(self, draws: list[DrawInput]) -> np.ndarray:
+        """Standard-normal coordinates of draws with respect to the input distributions, the inverse of ``transform``.
+
+        Inputs without variation in this scenario get zero coordinates.
+        """
+        z = np.zeros((len(draws), self.dimension))
+        if self.diameter_std > 0:
+            z[:, 0] = (np.array([d.diameter for d in draws]) - DIAMETER) / self.diameter_std
+        if self.temperature_std > 0:
+            z[:, 1] = (np.array([d.temperature for d in draws]) - TEMPERATURE) / self.temperature_std
+        if self.vary_durations:
+            durations = np.array([d.durations for d in draws]).reshape(len(draws), -1)
+            for i, d in enumerate(_durations_dists().values):
+                z[:, 2 + i] = norm.ppf(d.cdf(durations[:, i]))
+        return z
+
+    def transform(self, u: np.ndarray) -> list[DrawInput]:
+        """Map uniform draws of dimension ``self.dimension`` to the inputs of the process."""
+        z = self.normals(None, u)
+        diameters = DIAMETER + self.diameter_std * z[:, 0]
+        temperatures = TEMPERATURE + self.temperature_std * z[:, 1]
+
+        if not self.vary_durations:
+            return [DrawInput(d, t) for d, t in zip(diameters, temperatures, strict=True)]
+
+        durations = np.stack([d.ppf(u[:, 2 + i]) for i, d in enumerate(_durations_dists().values)], axis=1)
+
+        return [DrawDurations(d, t, dur) for d, t, dur in zip(diameters, temperatures, durations, strict=True)]
+
+
+@cache
+def _durations_dists() -> pd.Series:
+    df_durations = pd.read_csv(DURATIONS_DIST_FILE, header=0, index_col=0).drop(index="all")
+    return pd.Series({i: weibull_min(c=r["shape"], scale=r["scale"]) for i, r in df_durations.iterrows()})
+
+
+class Design:
+    """Base of dataclasses deriving the draws of a single scenario for the runner from a base scenario.
+
+    Designs have the fields ``name`` and ``base`` and define ``sample_count`` and ``transform``, mapping draw indices
+    to inputs. All other fields are part of the hash.
+    """
+
+    name: str
+    base: Scenario
+
+    @property
+    def outputs(self) -> list[str] | None:
+        return self.base.outputs
+
+    @property
+    def hash(self) -> str:
+        fields = asdict(self)
+        del fields["name"], fields["base"]
+        # the sample counts of design and base determine the inputs of each draw index in some designs, e.g. ``Sweep``
+        fields["layout"] = [self.sample_count, self.base.sample_count]
+
+        h = hashlib.sha256(json.dumps(fields, sort_keys=True).encode())
+        h.update(self.base.hash.encode())
+        return h.hexdigest()
+
+    def draws(self, indices: np.ndarray | None = None) -> list[DrawInput]:
+        if indices is None:
+            indices = np.arange(self.sample_count)
+
+        return self.transform(np.asarray(indices, dtype=np.int64))
+
+    def transform(self, indices: np.ndarray) -> list[DrawInput]:
+        raise NotImplementedError
+
+
+def _warm_start_hosts(unit: pr.Unit) -> list:
+    return [unit, unit.out_profile, *([unit.roll] if isinstance(unit, pr.RollPass) else [])]
+
+
+def _root_values(unit: pr.Unit) -> list[dict]:
+    return [
+        {h.name: host.__dict__[h.name] for h in root_hooks if isinstance(host, h.owner) and h.name in host.__dict__}
+        for host in _warm_start_hosts(unit)
+    ]
+
+
+def _apply_warm_start(unit: pr.Unit):
+    # called by pyroll after ``init_solve``, which resets the out cross-section of roll passes to the groove
+    values = unit.__dict__.get("_warm_start")
+    if values is None:
+        return
+
+    for host, v in zip(_warm_start_hosts(unit), values, strict=True):
+        host.__dict__.update(v)
+
+
+pr.Unit.additional_inits.append(_apply_warm_start)
+
+
+class _SingleSweepFilter(logging.Filter):
+    """Drop the warning of pyroll on sequences solved in a single sweep on purpose, as in ``COARSE_FIDELITY``."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return not record.getMessage().startswith(
+            f"Solution iteration of {PASS_SEQUENCE} exceeded the maximum iteration count of 2."
+        )
+
+
+PASS_SEQUENCE.logger.addFilter(_SingleSweepFilter())
+
+
+_SOLVER_STATE = {"__cache__", "_warm_start"}
+
+
+def _same_inputs(a: list[dict], b: list[dict]) -> bool:
+    return all(
+        x.keys() == y.keys() and all(x[k] is y[k] or x[k] == y[k] for k in x) for x, y in zip(a, b, strict=True)
+    )
+
+
+def _snapshot(host) -> dict:
+    state = dict(host.__dict__)
+    state["__cache__"] = dict(state.get("__cache__", {}))
+    return state
+
+
+def _restore(host, state: dict):
+    host.__dict__.clear()
+    host.__dict__.update(state)
+    host.__dict__["__cache__"] = dict(state["__cache__"])
+
+
+def _solve_suffix(sequence: pr.PassSequence, start: int, in_profile: pr.Profile):
+    for u in sequence[start:]:
+        try:
+            in_profile = u.solve(in_profile)
+        except Exception as e:
+            raise RuntimeError(f"Solution of sub units failed at unit {u}.") from e
+
+
+class SequenceTemplate:
+    """Pass sequence copied once per worker process and reset in place before every draw.
+
+    The iterations of every unit are counted per draw. With ``warm_start``, each unit starts its iteration from the
+    root hook values of its last iteration, which are those of the nominal solution at the beginning of each draw.
+    Leading units with the same inputs as in the nominal solution are not solved again (see ``solve``).
+    """
+
+    def __init__(self, sequence: pr.PassSequence, warm_start: bool = False):
+        self.sequence = deepcopy(sequence)
+        self.warm_start = warm_start
+        self.iteration_counts = np.zeros(len(self.sequence), dtype=np.int64)
+
+        self._unit_hosts = []
+        for i, u in enumerate(self.sequence):
+            u.get_root_hook_results = partial(self._iterate, i, u, u.get_root_hook_results)
+            self._unit_hosts.append([u, u.roll] if isinstance(u, pr.RollPass) else [u])
+        self._hosts = [self.sequence, *(h for hosts in self._unit_hosts for h in hosts)]
+        self._states = [dict(h.__dict__) for h in self._hosts]
+
+        # the nominal solution is the only one reused, so that the result of a draw does not depend on the draws
+        # solved before it by the same worker
+        self._reference = None
+        self.reset()
+        inputs = self._inputs()
+        self.solve(create_in_profile(DIAMETER), (DIAMETER, TEMPERATURE))
+        self._reference = (
+            (DIAMETER, TEMPERATURE),
+            inputs,
+            [
+                [(h, _snapshot(h)) for h in [*hosts, hosts[0].in_profile, hosts[0].out_profile]]
+                for hosts in self._unit_hosts
+            ],
+        )
+
+        if warm_start:
+            for h, state in zip(self._hosts, self._states, strict=True):
+                if "_warm_start" in h.__dict__:
+                    state["_warm_start"] = h.__dict__["_warm_start"]
+
+    def _iterate(self, index: int, unit: pr.Unit, get_root_hook_results):
+        self.iteration_counts[index] += 1
+        results = get_root_hook_results()
+        if self.warm_start:
+            unit.__dict__["_warm_start"] = _root_values(unit)
+        return results
+
+    def _inputs(self) -> list[list[dict]]:
+        return [
+            [{k: v for k, v in h.__dict__.items() if k not in _SOLVER_STATE} for h in hosts]
+            for hosts in self._unit_hosts
+        ]
+
+    def reset(self) -> pr.PassSequence:
+        for h, state in zip(self._hosts, self._states, strict=True):
+            h.__dict__.clear()
+            h.__dict__.update(state)
+            h.__dict__["__cache__"] = dict()
+        self.iteration_counts[:] = 0
+        return self.sequence
+
+    def solve(self, in_profile: pr.Profile, key: tuple):
+        """Solve the reset sequence, reusing the leading units of the nominal solution.
+
+        Units are reused as long as they and all units before them have the same explicitly set inputs as in the
+        nominal solution, whose in-profile was identified by the same ``key``.
+        This relies on the solution of a unit not depending on its successors.
+        """
+        reused = 0
+        if self._reference is not None and self._reference[0] == key:
+            for reference, current in zip(self._reference[1], self._inputs(), strict=True):
+                if not _same_inputs(reference, current):
+                    break
+                reused += 1
+
+        # keep at least the last unit to solve, so that the sequence has an out-profile to iterate on
+        reused = min(reused, len(self.sequence) - 1)
+
+        if reused > 0:
+            for unit_states in self._reference[2][:reused]:
+                for h, state in unit_states:
+                    _restore(h, state)
+
+            last = self.sequence[reused - 1].out_profile
+            start = pr.Profile(**{k: v for k, v in last.__dict__.items() if not k.startswith("_")})
+            self.sequence.__dict__["_solve_subunits"] = partial(_solve_suffix, self.sequence, reused, start)
+
+        self.sequence.solve(in_profile)
+
+
+class SharedResults:
+    """Draw by column float array in shared memory, written by the pool workers in place."""
+
+    def __init__(self, shape: tuple[int, int], name: str | None = None, create: bool = False):
+        self._owner = create or name is None
+        self.memory = SharedMemory(name=name, create=self._owner, size=max(shape[0] * shape[1], 1) * 8)
+        self.array = np.ndarray(shape, dtype=float, buffer=self.memory.buf)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        del self.array
+        self.memory.close()
+        if self._owner:
+            self.memory.unlink()
+
+
+_template: SequenceTemplate | None = None
+_shared: SharedResults | None = None
+_shared_spec: tuple[str, int] | None = None
+_stores: list[tuple[Path, list[str] | None]] = []
+_layouts: list[tuple[pd.MultiIndex, list[str] | None]] = []
+
+
+def init_worker(
+    shared_name: str | None = None,
+    rows: int = 0,
+    stores: list[tuple[Path, list[str] | None]] = (),
+):
+    """Initialize a pool worker writing into the shared array ``shared_name`` for the stores of the given jobs.
+
+    The shared array is attached on the first draw solved into it, as it is created only after the first draws of the
+    jobs fixed the columns of their stores.
+    """
+    global _template, _shared, _shared_spec, _stores
+    set_vectorized_transports(VECTORIZED_TRANSPORTS)
+    _template = SequenceTemplate(PASS_SEQUENCE, WARM_START)
+    _shared = None
+    _shared_spec = (shared_name, rows) if shared_name is not None else None
+    _stores = list(stores)
+
+
+def _shared_shape(rows: int, columns: list[pd.MultiIndex | None]) -> tuple[int, int]:
+    return rows, max([len(c) for c in columns if c is not None], default=0)
+
+
+def _attach():
+    global _shared, _layouts
+    if _shared is None:
+        _layouts = [(load_columns(directory), outputs) for directory, outputs in _stores]
+        name, rows = _shared_spec
+        _shared = SharedResults(_shared_shape(rows, [columns for columns, _ in _layouts]), name)
+
+
+def create_sequence(draw: DrawInput) -> pr.PassSequence:
+    if _template is None:
+        init_worker()
+
+    sequence = _template.reset()
+
+    durations = getattr(draw, "durations", None)
+    if durations is not None:
+        for t, d in zip(sequence.transports, durations, strict=False):
+            t.duration = d
+
+    if isinstance(draw, DrawParameters):
+        for name, value in draw.parameters.items():
+            set_parameter(sequence, name, value)
+
+    return sequence
+
+
+def _exported_value(host, name: str):
+    # same precedence as the ``__attrs__`` used by ``pre.to_pandas``: cached before explicitly set values
+    if name in host.__cache__:
+        return host.__cache__[name]
+    return host.__dict__.get(name)
+
+
+def _get_output(unit: pr.Unit, name: str):
+    value = _exported_value(unit, name)
+    if value is not None:
+        return value
+
+    for prefix in ["roll", "in_profile", "out_profile"]:
+        host = unit.__dict__.get(prefix)
+        if name.startswith(prefix + "_") and host is not None:
+            value = _exported_value(host, name[len(prefix) + 1 :])
+            if value is not None:
+                return value
+
+    return None
+
+
+def project(sequence: pr.PassSequence, outputs: list[str]) -> pd.Series:
+    """Extract the given outputs of all units in the flattened naming of ``pre.to_pandas``."""
+    return pd.Series(
+        {
+            (name, i): value
+            for name in sorted(outputs)
+            for i, unit in enumerate(sequence)
+            if (value := _get_output(unit, name)) is not None
+        },
+        dtype=object,
+    )
+
+
+def solve_draw(draw: DrawInput, outputs: list[str] | None = None) -> pd.Series:
+    ip = create_in_profile(draw.diameter)
+    ip.temperature = draw.temperature
+
+    sequence = create_sequence(draw)
+    _template.solve(ip, (draw.diameter, draw.temperature))
+
+    iteration_counts = pd.Series(
+        _template.iteration_counts, index=[("iteration_count", i) for i in range(len(sequence))], dtype=object
+    )
+
+    if outputs is not None:
+        return pd.concat([project(sequence, outputs), iteration_counts])
+    return pd.concat([pre.to_pandas(sequence).stack().swaplevel(), iteration_counts]).sort_index()
+
+
+def _solve_shared_draws(tasks: list[tuple[int, int, DrawInput]]) -> list[int]:
+    _attach()
+    for row, job, draw in tasks:
+        columns, outputs = _layouts[job]
+        _shared.array[row, : len(columns)] = to_values([solve_draw(draw, outputs)], columns)[0]
+    return [row for row, _, _ in tasks]
+
+
+@dataclass
+class _Job:
+    scenario: Scenario
+    store: ResultStore
+
+    @property
+    def width(self) -> int:
+        return len(self.store.columns) if self.store.columns is not None else 0
+
+
+def _prepare(scenario: Scenario, output_dir: Path, resume: bool, raw: bool) -> _Job:
+    store = ResultStore(output_dir, raw=raw)
+    if not resume or store.meta.get("scenario_hash") != scenario.hash:
+        store.clear()
+    elif np.any(store.draws() >= scenario.sample_count) and not store.truncate(scenario.sample_count):
+        # draws beyond the sample count in the statistics only cannot be separated from the others
+        store.clear()
+    store.write_meta(
+        scenario=scenario.name,
+        scenario_hash=scenario.hash,
+        sample_count=scenario.sample_count,
+        precision=None,
+    )
+
+    return _Job(scenario, store)
+
+
+def _init_columns(pool: Pool, jobs: list[_Job]):
+    """Solve the first pending draw of every job whose store has no columns yet.
+
+    The columns must be known before the workers can write into the shared array.
+    """
+    fresh = []
+    for job in jobs:
+        pending = np.setdiff1d(np.arange(job.scenario.sample_count), job.store.draws())
+        if job.store.columns is None and len(pending) > 0:
+            fresh.append((job, pending[:1]))
+
+    items = [(job.scenario.draws(first)[0], job.scenario.outputs) for job, first in fresh]
+    for (job, first), result in zip(fresh, pool.starmap(solve_draw, items), strict=True):
+        job.store.append(first, [result])
+
+
+def _interleave(indices: list[np.ndarray]) -> tuple[np.ndarray, np.ndarray]:
+    """Round-robin order of the pending draws of several jobs, so that all of them progress evenly."""
+    jobs = []
+    draws = []
+    for k in range(max(map(len, indices), default=0)):
+        for j, idx in enumerate(indices):
+            if k < len(idx):
+                jobs.append(j)
+                draws.append(idx[k])
+    return np.array(jobs, dtype=np.int64), np.array(draws, dtype=np.int64)
+
+
+def _draw_items(jobs: list[_Job], indices: list[np.ndarray], block_size: int):
+    """Pending draws of all jobs in interleaved order as ``(job, index, draw)``, generated in blocks."""
+    order_jobs, order_draws = _interleave(indices)
+
+    for start in range(0, len(order_jobs), block_size):
+        block_jobs = order_jobs[start : start + block_size]
+        block_draws = order_draws[start : start + block_size]
+
+        draws = [None] * len(block_jobs)
+        for j, job in enumerate(jobs):
+            positions = np.flatnonzero(block_jobs == j)
+            for p, draw in zip(positions.tolist(), job.scenario.draws(block_draws[positions]), strict=True):
+                draws[p] = draw
+
+        yield from zip(block_jobs.tolist(), block_draws.tolist(), draws, strict=True)
+
+
+def _solve_jobs(
+    pool: Pool,
+    jobs: list[_Job],
+    indices: list[np.ndarray],
+    shared: SharedResults,
+    chunk_size: int,
+    batch_size: int,
+    progress: tqdm.tqdm,
+):
+    """Solve the pending draws of all jobs into the rows of the shared array.
+
+    A row is free again once its result is appended to the store, and is refilled with the next draw right away.
+    """
+    items = _draw_items(jobs, indices, len(shared.array))
+    free = list(range(len(shared.array)))
+    slots = {}
+    finished = [[] for _ in jobs]
+    completed = queue.SimpleQueue()
+    running = 0
+
+    def submit():
+        nonlocal running
+        while free:
+            chunk = list(itertools.islice(items, min(chunk_size, len(free))))
+            if not chunk:
+                return
+
+            tasks = []
+            for j, index, draw in chunk:
+                row = free.pop()
+                slots[row] = (j, index)
+                tasks.append((row, j, draw))
+            pool.apply_async(_solve_shared_draws, (tasks,), callback=completed.put, error_callback=completed.put)
+            running += 1
+
+    def flush(j):
+        rows = finished[j]
+        finished[j] = []
+        jobs[j].store.append_values(np.array([slots[r][1] for r in rows]), shared.array[rows, : jobs[j].width])
+        for r in rows:
+            del slots[r]
+        free.extend(rows)
+
+    try:
+        submit()
+        while running > 0:
+            rows = completed.get()
+            running -= 1
+            if isinstance(rows, BaseException):
+                raise rows
+
+            for row in rows:
+                j = slots[row][0]
+                finished[j].append(row)
+                if len(finished[j]) >= batch_size:
+                    flush(j)
+            progress.update(len(rows))
+
+            # rows of jobs with unflushed batches would otherwise keep the pool from being refilled
+            if not free:
+                for j in range(len(jobs)):
+                    flush(j)
+            submit()
+    finally:
+        for j in range(len(jobs)):
+            flush(j)
+
+
+@contextmanager
+def _pool(jobs: list[_Job], processes: int | None, pending_count: int):
+    rows = min(max(pending_count, 1), SHARED_BUFFER_SIZE)
+    name = f"weiner_variation_{secrets.token_hex(8)}"
+    stores = [(job.store.directory, job.scenario.outputs) for job in jobs]
+
+    # forked workers attaching the shared array later would start resource trackers of their own, reporting it as leaked
+    resource_tracker.ensure_running()
+    with Pool(processes, initializer=init_worker, initargs=(name, rows, stores)) as pool:
+        _init_columns(pool, jobs)
+        with SharedResults(_shared_shape(rows, [job.store.columns for job in jobs]), name, create=True) as shared:
+            yield pool, shared
+
+
+def with_fields(scenario: Scenario, **changes) -> Scenario:
+    """Copy of a scenario or design with changed fields.
+
+    Designs deriving e.g. their sample count from their points (``Sweep``) do not accept it as a change.
+    """
+    names = {f.name for f in fields(scenario)}
+    for name in changes:
+        if name not in names:
+            raise ValueError(f"{type(scenario).__name__} '{scenario.name}' has no settable '{name}'.")
+    return replace(scenario, **changes)
+
+
+def run(
+    scenario: Scenario,
+    output_dir: Path,
+    processes: int | None = PROCESSES,
+    chunk_size: int = CHUNK_SIZE,
+    sample_count: int | None = None,
+    batch_size: int = BATCH_SIZE,
+    resume: bool = True,
+    target_precision: float | None = TARGET_PRECISION,
+    block_size: int = BLOCK_SIZE,
+    monitored_properties: list[str] = MONITORED_PROPERTIES,
+    raw: bool = STORE_RAW,
+) -> ResultStore:
+    if sample_count is not None:
+        scenario = with_fields(scenario, sample_count=sample_count)
+
+    job = _prepare(scenario, output_dir, resume, raw)
+    store = job.store
+
+    if target_precision is None:
+        block_size = scenario.sample_count
+
+    with (
+        _pool([job], processes, scenario.sample_count - len(store.draws())) as (pool, shared),
+        tqdm.tqdm(total=scenario.sample_count, desc=scenario.name) as progress,
+    ):
+        # taken after the pool solved the first draw of a fresh store
+        done = store.draws()
+        for start in range(0, scenario.sample_count, block_size):
+            end = min(start + block_size, scenario.sample_count)
+            indices = np.setdiff1d(np.arange(start, end), done)
+            progress.update(end - start - len(indices))
+
+            _solve_jobs(pool, [job], [indices], shared, chunk_size, batch_size, progress)
+
+            # the statistics describe the draws returned by ``load`` only if the store holds none beyond the block
+            if target_precision is None or end < MIN_ADAPTIVE_SAMPLE_COUNT or np.any(store.statistics_draws >= end):
+                continue
+
+            precision = relative_precision(store.summary(monitored_properties), CONFIDENCE)
+            if precision.max().max() <= target_precision:
+                store.write_meta(sample_count=end, precision=precision.max().to_dict())
+                break
+
+    store.compact()
+    return store
+
+
+def run_all(
+    scenarios: dict[Path, Scenario],
+    processes: int | None = PROCESSES,
+    chunk_size: int = CHUNK_SIZE,
+    batch_size: int = BATCH_SIZE,
+    resume: bool = True,
+    raw: bool = STORE_RAW,
+) -> dict[Path, ResultStore]:
+    """Run several scenarios at once in a single worker pool, interleaving their draws."""
+    jobs = [_prepare(scenario, output_dir, resume, raw) for output_dir, scenario in scenarios.items()]
+    total = sum(job.scenario.sample_count for job in jobs)
+
+    with _pool(jobs, processes, total - sum(len(job.store.draws()) for job in jobs)) as (pool, shared):
+        # taken after the pool solved the first draws of fresh stores
+        indices = [np.setdiff1d(np.arange(job.scenario.sample_count), job.store.draws()) for job in jobs]
+        pending_count = sum(map(len, indices))
+
+        with tqdm.tqdm(total=total, initial=total - pending_count, desc="all scenarios") as progress:
+            _solve_jobs(pool, jobs, indices, shared, chunk_size, batch_size, progress)
+
+    for job in jobs:
+        job.store.compact()
+
+    return {output_dir: job.store for output_dir, job in zip(scenarios, jobs, strict=True)}
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from weiner_variation.sim.scenarios import SCENARIOS
+
+    parser = argparse.ArgumentParser(description="Run a Monte-Carlo scenario of the rolling process.")
+    parser.add_argument("scenario", choices=list(SCENARIOS))
+    parser.add_argument("output_dir", type=Path)
+    parser.add_argument("--processes", type=int, default=PROCESSES)
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    parser.add_argument("--sample-count", type=int, default=None)
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    parser.add_argument("--sampler", choices=SAMPLERS, default=None)
+    parser.add_argument("--no-resume", action="store_false", dest="resume")
+    parser.add_argument("--target-precision", type=float, default=TARGET_PRECISION)
+    parser.add_argument("--block-size", type=int, default=BLOCK_SIZE)
+    parser.add_argument("--no-raw", action="store_false", dest="raw")
+    args = parser.parse_args()
+
+    scenario = SCENARIOS[args.scenario]
+    try:
+        if args.sampler is not None:
+            scenario = with_fields(scenario, sampler=args.sampler)
+        if args.sample_count is not None:
+            scenario = with_fields(scenario, sample_count=args.sample_count)
+    except ValueError as e:
+        parser.error(str(e))
+
+    run(
+        scenario,
+        args.output_dir,
+        processes=args.processes,
+        chunk_size=args.chunk_size,
+        batch_size=args.batch_size,
+        resume=args.resume,
+        target_precision=args.target_precision,
+        block_size=args.block_size,
+        raw=args.raw,
+    )
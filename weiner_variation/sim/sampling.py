@@ -0,0 +1,46 @@
+import warnings
+
+import numpy as np
+from scipy.stats import qmc
+
+SAMPLERS = ["mc", "sobol", "lhs"]
+
+
+def _rng(seed: int, stream: tuple[int, ...]) -> np.random.Generator:
+    # the same as ``default_rng(seed)`` for the default stream
+    return np.random.default_rng(np.random.SeedSequence(seed, spawn_key=stream))
+
+
+def sample_uniforms(
+    sampler: str,
+    seed: int,
+    dimension: int,
+    indices: np.ndarray,
+    sample_count: int,
+    stream: tuple[int, ...] = (),
+) -> np.ndarray:
+    """Uniform draws of the given indices, ``stream`` selecting a sequence independent of those of other streams."""
+    indices = np.asarray(indices, dtype=np.int64)
+    if len(indices) == 0:
+        return np.zeros((0, dimension))
+
+    if sampler == "mc":
+        return np.array(
+            [
+                np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(*stream, i))).random(dimension)
+                for i in indices
+            ]
+        )
+
+    if sampler == "sobol":
+        engine = qmc.Sobol(dimension, scramble=True, seed=_rng(seed, stream))
+        with warnings.catch_warnings():
+            # balance properties are only guaranteed for powers of two, prefixes are still low-discrepancy
+            warnings.simplefilter("ignore", UserWarning)
+            return engine.random(indices.max() + 1)[indices]
+
+    if sampler == "lhs":
+        engine = qmc.LatinHypercube(dimension, seed=_rng(seed, stream))
+        return engine.random(sample_count)[indices]
+
+    raise ValueError(f"Unknown sampler '{sampler}', must be one of {SAMPLERS}.")
@@ -0,0 +1,45 @@
+from dataclasses import replace
+
+from weiner_variation.sim import process
+from weiner_variation.sim.config import (
+    CALIBRATION_SAMPLE_COUNT,
+    CALIBRATION_TEMPERATURE_STD,
+    FACTORS,
+    OUTPUTS,
+    SIMS_STDS,
+)
+from weiner_variation.sim.runner import Scenario
+from weiner_variation.sim.sweep import Sweep
+
+SCENARIOS = {
+    "nominal": Scenario("nominal", diameter_std=0, temperature_std=0, sample_count=1, outputs=OUTPUTS),
+    "input": Scenario("input", outputs=OUTPUTS),
+    "durations": Scenario("durations", vary_durations=True, outputs=OUTPUTS),
+}
+
+# all sweep scenarios keep the seed of the input scenario, so they scale the same standard-normal base draws
+STD_SCENARIOS = {
+    (sim, f): replace(
+        SCENARIOS["input"],
+        name=f"{sim}/{f}",
+        **{f"{sim}_std": f * getattr(process, sim.upper())},
+    )
+    for sim in SIMS_STDS
+    for f in FACTORS
+}
+
+SWEEPS = {
+    "heat_transfer": Sweep(
+        "heat_transfer",
+        {"CONTACT_HEAT_TRANSFER": [2500, 5000, 10000], "CONVECTION_HEAT_TRANSFER": [5, 10, 20]},
+        base=SCENARIOS["nominal"],
+    ),
+}
+
+# widened input distribution covering the candidates of the calibration, evaluated by a surrogate
+CALIBRATION_SCENARIO = Scenario(
+    "calibration",
+    temperature_std=CALIBRATION_TEMPERATURE_STD,
+    sample_count=CALIBRATION_SAMPLE_COUNT,
+    outputs=["roll_force", "roll_roll_torque", "in_profile_temperature", "out_profile_temperature"],
+)
@@ -0,0 +1,93 @@
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from weiner_variation.sim.config import SEED, SENSITIVITY_BOOTSTRAP_COUNT, SENSITIVITY_SAMPLE_COUNT
+from weiner_variation.sim.data import DrawInput
+from weiner_variation.sim.runner import Design, Scenario
+from weiner_variation.sim.sampling import sample_uniforms
+
+
+@dataclass
+class SaltelliDesign(Design):
+    """Saltelli sample matrices of the inputs of a base scenario, solved by the runner as a single scenario.
+
+    Draws are ordered by matrix: ``A``, ``B`` and then ``A`` with column ``i`` taken from ``B`` for every input ``i``.
+    """
+
+    name: str
+    base: Scenario
+    base_sample_count: int = SENSITIVITY_SAMPLE_COUNT
+    seed: int = SEED
+
+    @property
+    def dimension(self) -> int:
+        return self.base.dimension
+
+    @property
+    def sample_count(self) -> int:
+        return self.base_sample_count * (self.dimension + 2)
+
+    def matrices(self, rows: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        u = sample_uniforms("sobol", self.seed, 2 * self.dimension, rows, self.base_sample_count)
+        return u[:, : self.dimension], u[:, self.dimension :]
+
+    def transform(self, indices: np.ndarray) -> list[DrawInput]:
+        matrix, rows = np.divmod(indices, self.base_sample_count)
+        a, b = self.matrices(rows)
+
+        u = np.where((matrix == 1)[:, None], b, a)
+        mixed = np.flatnonzero(matrix >= 2)
+        u[mixed, matrix[mixed] - 2] = b[mixed, matrix[mixed] - 2]
+
+        return self.base.transform(u)
+
+
+def _estimate(f_a: np.ndarray, f_b: np.ndarray, f_ab: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    variance = np.var(np.concatenate([f_a, f_b]), axis=0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        first = np.mean(f_b * (f_ab - f_a), axis=1) / variance
+        total = 0.5 * np.mean((f_a - f_ab) ** 2, axis=1) / variance
+
+    return first, total
+
+
+def sobol_indices(
+    df: pd.DataFrame,
+    design: SaltelliDesign,
+    bootstrap_count: int = SENSITIVITY_BOOTSTRAP_COUNT,
+    confidence: float = 0.95,
+) -> pd.DataFrame:
+    """First-order (Saltelli 2010) and total (Jansen) Sobol indices of all result columns with bootstrap intervals.
+
+    All estimators share the solved matrices ``A`` and ``B``.
+    """
+    if not np.array_equal(df.index, np.arange(design.sample_count)):
+        raise ValueError("Sobol indices require the results of all draws of the design.")
+
+    n = design.base_sample_count
+    values = df.to_numpy().reshape(design.dimension + 2, n, -1)
+    f_a, f_b, f_ab = values[0], values[1], values[2:]
+
+    first, total = _estimate(f_a, f_b, f_ab)
+
+    rng = np.random.default_rng(design.seed)
+    samples = [
+        _estimate(f_a[r], f_b[r], f_ab[:, r])
+        for r in rng.integers(n, size=(bootstrap_count, n))
+    ]
+    alpha = (1 - confidence) / 2
+
+    frames = {}
+    for k, (name, estimate) in enumerate([("first", first), ("total", total)]):
+        bootstrap = np.stack([s[k] for s in samples])
+        frames[name, "estimate"] = estimate
+        frames[name, "low"] = np.nanquantile(bootstrap, alpha, axis=0)
+        frames[name, "high"] = np.nanquantile(bootstrap, 1 - alpha, axis=0)
+
+    return pd.concat(
+        {key: pd.DataFrame(v, index=design.base.input_names, columns=df.columns) for key, v in frames.items()},
+        names=["index", "statistic", "input"],
+    )
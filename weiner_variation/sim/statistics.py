@@ -0,0 +1,224 @@
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+from scipy.stats import norm
+
+QUANTILES = [0.05, 0.25, 0.5, 0.75, 0.95]
+SKETCH_CAPACITY = 512
+
+
+@dataclass
+class QuantileSketch:
+    """Mergeable compacting quantile sketch holding weighted samples of many columns at once."""
+
+    capacity: int = SKETCH_CAPACITY
+    levels: list[np.ndarray] = field(default_factory=list)
+
+    def merge(self, other: "QuantileSketch"):
+        for i, items in enumerate(other.levels):
+            if i < len(self.levels):
+                self.levels[i] = np.concatenate([self.levels[i], items])
+            else:
+                self.levels.append(items)
+        self._compact()
+
+    def _compact(self):
+        i = 0
+        while i < len(self.levels):
+            items = self.levels[i]
+            if len(items) > self.capacity:
+                items = np.sort(items, axis=0)
+                even = len(items) - len(items) % 2
+                promoted = items[(even // 2) % 2 : even : 2]
+                self.levels[i] = items[even:]
+                if i + 1 < len(self.levels):
+                    self.levels[i + 1] = np.concatenate([self.levels[i + 1], promoted])
+                else:
+                    self.levels.append(promoted)
+            i += 1
+
+    def items(self) -> tuple[np.ndarray, np.ndarray]:
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(level), 2.0**i) for i, level in enumerate(self.levels)])
+        order = np.argsort(items, axis=0)
+        items = np.take_along_axis(items, order, axis=0)
+        weights = np.where(np.isnan(items), 0, weights[order])
+        return items, weights
+
+    def quantiles(self, q: list[float]) -> np.ndarray:
+        items, weights = self.items()
+        cumulative = np.cumsum(weights, axis=0)
+        total = cumulative[-1]
+
+        result = np.full((len(q), items.shape[1]), np.nan)
+        for j, p in enumerate(q):
+            index = np.argmax(cumulative >= p * total, axis=0)
+            result[j] = np.where(total > 0, items[index, np.arange(items.shape[1])], np.nan)
+        return result
+
+    def within(self, lower: np.ndarray, upper: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        items, _ = self.items()
+        inside = (items >= lower) & (items <= upper)
+        with np.errstate(invalid="ignore"):
+            return np.where(inside, items, np.inf).min(axis=0), np.where(inside, items, -np.inf).max(axis=0)
+
+
+@dataclass
+class OnlineStatistics:
+    """Mergeable per-column accumulator of central moments up to fourth order, extrema and quantiles."""
+
+    count: np.ndarray
+    mean: np.ndarray
+    m2: np.ndarray
+    m3: np.ndarray
+    m4: np.ndarray
+    min: np.ndarray
+    max: np.ndarray
+    sketch: QuantileSketch = field(default_factory=QuantileSketch)
+
+    @classmethod
+    def empty(cls, column_count: int) -> "OnlineStatistics":
+        zeros = np.zeros(column_count)
+        return cls(
+            zeros.copy(),
+            zeros.copy(),
+            zeros.copy(),
+            zeros.copy(),
+            zeros.copy(),
+            np.full(column_count, np.inf),
+            np.full(column_count, -np.inf),
+        )
+
+    @classmethod
+    def from_values(cls, values: np.ndarray) -> "OnlineStatistics":
+        values = np.asarray(values, dtype=float)
+        valid = ~np.isnan(values)
+        count = valid.sum(axis=0).astype(float)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mean = np.where(count > 0, np.nansum(values, axis=0) / count, 0)
+        deviations = np.where(valid, values - mean, 0)
+
+        return cls(
+            count,
+            mean,
+            (deviations**2).sum(axis=0),
+            (deviations**3).sum(axis=0),
+            (deviations**4).sum(axis=0),
+            np.where(valid, values, np.inf).min(axis=0),
+            np.where(valid, values, -np.inf).max(axis=0),
+            QuantileSketch(levels=[values]),
+        )
+
+    def merge(self, other: "OnlineStatistics"):
+        na, nb = self.count, other.count
+        n = na + nb
+        delta = other.mean - self.mean
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            f = np.where(n > 0, 1 / n, 0)
+            mean = self.mean + delta * nb * f
+            m2 = self.m2 + other.m2 + delta**2 * na * nb * f
+            m3 = (
+                self.m3
+                + other.m3
+                + delta**3 * na * nb * (na - nb) * f**2
+                + 3 * delta * (na * other.m2 - nb * self.m2) * f
+            )
+            m4 = (
+                self.m4
+                + other.m4
+                + delta**4 * na * nb * (na**2 - na * nb + nb**2) * f**3
+                + 6 * delta**2 * (na**2 * other.m2 + nb**2 * self.m2) * f**2
+                + 4 * delta * (na * other.m3 - nb * self.m3) * f
+            )
+
+        self.count, self.mean, self.m2, self.m3, self.m4 = n, mean, m2, m3, m4
+        self.min = np.minimum(self.min, other.min)
+        self.max = np.maximum(self.max, other.max)
+        self.sketch.merge(other.sketch)
+
+    def update(self, values: np.ndarray):
+        self.merge(OnlineStatistics.from_values(values))
+
+    def to_arrays(self) -> dict[str, np.ndarray]:
+        return dict(
+            count=self.count,
+            mean=self.mean,
+            m2=self.m2,
+            m3=self.m3,
+            m4=self.m4,
+            min=self.min,
+            max=self.max,
+        ) | {f"sketch_{i}": items for i, items in enumerate(self.sketch.levels)}
+
+    @classmethod
+    def from_arrays(cls, arrays) -> "OnlineStatistics":
+        levels = []
+        while f"sketch_{len(levels)}" in arrays:
+            levels.append(arrays[f"sketch_{len(levels)}"])
+
+        return cls(
+            *(arrays[k] for k in ["count", "mean", "m2", "m3", "m4", "min", "max"]),
+            sketch=QuantileSketch(levels=levels),
+        )
+
+    def summary(self, columns: pd.Index) -> pd.DataFrame:
+        n = self.count
+        with np.errstate(divide="ignore", invalid="ignore"):
+            std = np.sqrt(self.m2 / (n - 1))
+            kurtosis = n * self.m4 / self.m2**2
+
+        rows = {
+            "count": n,
+            "mean": np.where(n > 0, self.mean, np.nan),
+            "std": np.where(n > 1, std, np.nan),
+            "kurtosis": np.where(self.m2 > 0, kurtosis, np.nan),
+            "min": np.where(n > 0, self.min, np.nan),
+            "max": np.where(n > 0, self.max, np.nan),
+        }
+
+        if self.sketch.levels:
+            quantiles = self.sketch.quantiles(QUANTILES)
+            rows |= {f"q{q:g}": v for q, v in zip(QUANTILES, quantiles, strict=True)}
+
+            q1, q3 = rows["q0.25"], rows["q0.75"]
+            iqr = q3 - q1
+            rows["whislo"], rows["whishi"] = self.sketch.within(q1 - 1.5 * iqr, q3 + 1.5 * iqr)
+
+        return pd.DataFrame(rows, index=columns).T
+
+
+def boxplot_stats(summary: pd.DataFrame, scale: float = 1) -> list[dict]:
+    """Boxplot statistics of each column of a summary for use with ``Axes.bxp``."""
+    return [
+        dict(
+            med=s["q0.5"] * scale,
+            q1=s["q0.25"] * scale,
+            q3=s["q0.75"] * scale,
+            whislo=s["whislo"] * scale,
+            whishi=s["whishi"] * scale,
+            mean=s["mean"] * scale,
+            fliers=[v * scale for v in [s["min"], s["max"]] if v < s["whislo"] or v > s["whishi"]],
+        )
+        for _, s in summary.items()
+    ]
+
+
+def relative_precision(summary: pd.DataFrame, confidence: float) -> pd.DataFrame:
+    """Relative half widths of the confidence intervals of mean and standard deviation per column."""
+    z = norm.ppf(0.5 + confidence / 2)
+    n = summary.loc["count"]
+    std = summary.loc["std"]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean_precision = z * std / np.sqrt(n) / summary.loc["mean"].abs()
+        std_precision = z * np.sqrt((summary.loc["kurtosis"] - 1) / (4 * n))
+
+    return pd.DataFrame(
+        {
+            "mean": mean_precision.where(std > 0, 0),
+            "std": std_precision.where(std > 0, 0),
+        }
+    )
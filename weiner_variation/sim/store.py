@@ -0,0 +1,293 @@
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from weiner_variation.sim.statistics import OnlineStatistics
+
+COLUMNS_FILE = "columns.json"
+META_FILE = "meta.json"
+PART_PATTERN = "part-*.npz"
+STATISTICS_FILE = "statistics.npz"
+CONSTANTS_FILE = "constants.npz"
+
+
+def _write_atomic(path: Path, write):
+    tmp = path.with_name(path.name + ".tmp")
+    with tmp.open("wb") as f:
+        write(f)
+    tmp.replace(path)
+
+
+def to_values(results: list[pd.Series], columns: pd.MultiIndex) -> np.ndarray:
+    values = np.full((len(results), len(columns)), np.nan)
+    for i, r in enumerate(results):
+        r = pd.to_numeric(r, errors="coerce")
+        r.index = pd.MultiIndex.from_tuples([(p, str(u)) for p, u in r.index])
+        values[i] = r.reindex(columns).to_numpy(dtype=float, na_value=np.nan)
+    return values
+
+
+def load_columns(directory: Path) -> pd.MultiIndex | None:
+    columns_file = Path(directory) / COLUMNS_FILE
+    if not columns_file.exists():
+        return None
+    return pd.MultiIndex.from_tuples([tuple(c) for c in json.loads(columns_file.read_text())])
+
+
+def _equal(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    return (a == b) | (np.isnan(a) & np.isnan(b))
+
+
+class ResultStore:
+    """Columnar store of per-draw results as float arrays keyed by property and unit.
+
+    Online statistics of all columns are accumulated alongside, so that with ``raw=False`` only the summary is kept.
+    Columns found constant over all draws by ``compact`` are stored once and broadcast back on load.
+    """
+
+    def __init__(self, directory: Path, raw: bool = True):
+        self.directory = Path(directory)
+        self.raw = raw
+        self.columns: pd.MultiIndex | None = load_columns(self.directory)
+        self.meta: dict = {}
+        self.statistics: OnlineStatistics | None = None
+        self.statistics_draws = np.zeros(0, dtype=np.int64)
+        self.constant_mask: np.ndarray | None = None
+        self.constant_values: np.ndarray | None = None
+
+        meta_file = self.directory / META_FILE
+        if meta_file.exists():
+            self.meta = json.loads(meta_file.read_text())
+
+        statistics_file = self.directory / STATISTICS_FILE
+        if statistics_file.exists():
+            with np.load(statistics_file) as arrays:
+                self.statistics = OnlineStatistics.from_arrays(arrays)
+                self.statistics_draws = arrays["draws"]
+
+        constants_file = self.directory / CONSTANTS_FILE
+        if constants_file.exists():
+            with np.load(constants_file) as arrays:
+                self.constant_mask = arrays["mask"]
+                self.constant_values = arrays["values"]
+
+    def write_meta(self, **meta):
+        self.meta.update(meta)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        _write_atomic(self.directory / META_FILE, lambda f: f.write(json.dumps(self.meta).encode()))
+
+    def _init_columns(self, result: pd.Series):
+        numeric = pd.to_numeric(result, errors="coerce").dropna()
+        self.columns = pd.MultiIndex.from_tuples(
+            [(p, str(u)) for p, u in numeric.index]
+        )
+        self.directory.mkdir(parents=True, exist_ok=True)
+        _write_atomic(self.directory / COLUMNS_FILE, lambda f: f.write(json.dumps(self.columns.tolist()).encode()))
+
+    def append(self, draws: np.ndarray, results: list[pd.Series]):
+        if not results:
+            return
+
+        if self.columns is None:
+            self._init_columns(results[0])
+
+        self.append_values(draws, to_values(results, self.columns))
+
+    def append_values(self, draws: np.ndarray, values: np.ndarray):
+        if len(values) == 0:
+            return
+
+        draws = np.asarray(draws, dtype=np.int64)
+        if self.raw:
+            if self.constant_mask is not None:
+                deviating = self.constant_mask & ~_equal(values, self.constant_values).all(axis=0)
+                if deviating.any():
+                    # parts are self-describing, those lacking the deviating columns are filled by the constants
+                    self.constant_mask = self.constant_mask & ~deviating
+                    self._save_constants()
+            self._write_part(draws, values)
+
+        if self.statistics is None:
+            self.statistics = OnlineStatistics.empty(len(self.columns))
+        self.statistics.update(values)
+        self.statistics_draws = np.concatenate([self.statistics_draws, draws])
+        self._save_statistics()
+
+    def _save_statistics(self):
+        _write_atomic(
+            self.directory / STATISTICS_FILE,
+            lambda f: np.savez(f, draws=self.statistics_draws, **self.statistics.to_arrays()),
+        )
+
+    def truncate(self, sample_count: int) -> bool:
+        """Drop all draws from ``sample_count`` on and recompute the statistics from the remaining parts.
+
+        Parts are rewritten one at a time. Returns ``False`` without changes if not all draws of the statistics are
+        stored raw, so that the statistics cannot be recomputed.
+        """
+        if self.columns is None:
+            return True
+
+        parts = self.parts()
+        part_draws = [np.zeros(0, dtype=np.int64)]
+        for p in parts:
+            with np.load(p) as part:
+                part_draws.append(part["draws"])
+        if not np.isin(self.statistics_draws, np.concatenate(part_draws)).all():
+            return False
+
+        selection = np.arange(len(self.columns))
+        statistics = OnlineStatistics.empty(len(self.columns))
+        kept = [np.zeros(0, dtype=np.int64)]
+        for p in parts:
+            draws, values = self._read_part(p, selection)
+            keep = draws < sample_count
+            if not keep.any():
+                p.unlink()
+                continue
+            if not keep.all():
+                self._write_part(draws[keep], values[keep], path=p)
+            statistics.update(values[keep])
+            kept.append(draws[keep])
+
+        self.statistics = statistics
+        self.statistics_draws = np.concatenate(kept)
+        self._save_statistics()
+        return True
+
+    def _stored_columns(self) -> np.ndarray:
+        if self.constant_mask is None:
+            return np.arange(len(self.columns))
+        return np.flatnonzero(~self.constant_mask)
+
+    def _write_part(self, draws: np.ndarray, values: np.ndarray, path: Path | None = None):
+        stored = self._stored_columns()
+        _write_atomic(
+            path or self.directory / f"part-{draws.min():08d}.npz",
+            lambda f: np.savez(f, draws=draws, values=values[:, stored], columns=stored),
+        )
+
+    def _read_part(self, path: Path, selection: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        with np.load(path) as part:
+            draws = part["draws"]
+            values = part["values"]
+            if "columns" not in part:
+                return draws, values[:, selection]
+
+            positions = np.full(len(self.columns), -1)
+            positions[part["columns"]] = np.arange(len(part["columns"]))
+            positions = positions[selection]
+
+        present = positions >= 0
+        result = np.empty((len(draws), len(selection)))
+        result[:, present] = values[:, positions[present]]
+        if not present.all():
+            result[:, ~present] = self.constant_values[selection[~present]]
+        return draws, result
+
+    def _save_constants(self):
+        mask = self.constant_mask if self.constant_mask is not None else np.zeros(len(self.columns), dtype=bool)
+        _write_atomic(
+            self.directory / CONSTANTS_FILE,
+            lambda f: np.savez(f, mask=mask, values=self.constant_values),
+        )
+
+    def compact(self):
+        """Detect columns that are constant over all stored draws and drop them from the parts.
+
+        Parts are read and rewritten one at a time, so that memory stays bounded by the size of a part.
+        """
+        parts = self.parts()
+        if self.columns is None or not parts:
+            return
+
+        selection = np.arange(len(self.columns))
+        reference = self._read_part(parts[0], selection)[1][0]
+        mask = np.ones(len(self.columns), dtype=bool)
+        for p in parts:
+            mask &= _equal(self._read_part(p, selection)[1], reference).all(axis=0)
+
+        if self.constant_mask is not None and np.array_equal(mask, self.constant_mask):
+            return
+
+        # parts not yet rewritten may still lack formerly constant columns, so their values are kept until the end
+        if self.constant_values is not None:
+            self.constant_values = np.where(mask, reference, self.constant_values)
+        else:
+            self.constant_values = reference
+        self._save_constants()
+
+        self.constant_mask = mask
+        for p in parts:
+            draws, values = self._read_part(p, selection)
+            self._write_part(draws, values, path=p)
+        self._save_constants()
+
+    def clear(self):
+        for p in self.parts():
+            p.unlink()
+        (self.directory / COLUMNS_FILE).unlink(missing_ok=True)
+        (self.directory / META_FILE).unlink(missing_ok=True)
+        (self.directory / STATISTICS_FILE).unlink(missing_ok=True)
+        (self.directory / CONSTANTS_FILE).unlink(missing_ok=True)
+        self.columns = None
+        self.meta = {}
+        self.statistics = None
+        self.statistics_draws = np.zeros(0, dtype=np.int64)
+        self.constant_mask = None
+        self.constant_values = None
+
+    def parts(self) -> list[Path]:
+        return sorted(self.directory.glob(PART_PATTERN))
+
+    def draws(self) -> np.ndarray:
+        draws = [self.statistics_draws]
+        for p in self.parts():
+            with np.load(p) as part:
+                draws.append(part["draws"])
+        return np.unique(np.concatenate(draws))
+
+    def load(self, properties: list[str] | None = None) -> pd.DataFrame:
+        if self.columns is None:
+            return pd.DataFrame()
+
+        columns = self.columns
+        if properties is not None:
+            columns = columns[columns.get_level_values(0).isin(properties)]
+        selection = self.columns.get_indexer(columns)
+
+        draws = []
+        values = []
+        for p in self.parts():
+            part_draws, part_values = self._read_part(p, selection)
+            draws.append(part_draws)
+            values.append(part_values)
+
+        if not values:
+            return pd.DataFrame(columns=columns)
+
+        draws = np.concatenate(draws)
+        values = np.concatenate(values)
+        order = np.argsort(draws, kind="stable")
+        order = order[draws[order] < self.meta.get("sample_count", np.inf)]
+
+        return pd.DataFrame(values[order], index=draws[order], columns=columns)
+
+    def summary(self, properties: list[str] | None = None) -> pd.DataFrame:
+        if self.statistics is None:
+            return pd.DataFrame()
+
+        summary = self.statistics.summary(self.columns)
+        if properties is not None:
+            summary = summary.loc[:, summary.columns.get_level_values(0).isin(properties)]
+        return summary
+
+
+def load_results(directory: Path, properties: list[str] | None = None) -> pd.DataFrame:
+    return ResultStore(directory).load(properties)
+
+
+def load_summary(directory: Path, properties: list[str] | None = None) -> pd.DataFrame:
+    return ResultStore(directory).summary(properties)
@@ -0,0 +1,98 @@
+import itertools
+from dataclasses import dataclass
+from math import factorial
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from numpy.polynomial.hermite_e import hermevander
+
+from weiner_variation.sim.config import SURROGATE_DEGREE, SURROGATE_VALIDATION_FRACTION
+from weiner_variation.sim.data import DrawInput
+from weiner_variation.sim.runner import Scenario
+from weiner_variation.sim.store import ResultStore
+
+
+def _exponents(dimension: int, degree: int) -> np.ndarray:
+    return np.array(
+        sorted(
+            (e for e in itertools.product(range(degree + 1), repeat=dimension) if sum(e) <= degree),
+            key=lambda e: (sum(e), tuple(-x for x in e)),
+        ),
+        dtype=np.int64,
+    ).reshape(-1, dimension)
+
+
+def _basis(z: np.ndarray, exponents: np.ndarray) -> np.ndarray:
+    degree = exponents.max(initial=0)
+    norms = np.sqrt([factorial(n) for n in range(degree + 1)])
+    # orthonormal probabilists' Hermite polynomials of each input, shape (draw, input, order)
+    polynomials = hermevander(z, degree) / norms
+    return np.prod(np.take_along_axis(polynomials[:, None, :, :], exponents[None, :, :, None], axis=3)[..., 0], axis=2)
+
+
+@dataclass
+class Surrogate:
+    """Polynomial chaos expansion of all result columns in the standard-normal coordinates of a scenario."""
+
+    scenario: Scenario
+    columns: pd.MultiIndex
+    inputs: np.ndarray
+    exponents: np.ndarray
+    coefficients: np.ndarray
+    validation_error: pd.Series
+
+    @classmethod
+    def fit(
+        cls,
+        directory: Path,
+        scenario: Scenario,
+        properties: list[str] | None = None,
+        degree: int = SURROGATE_DEGREE,
+        validation_fraction: float = SURROGATE_VALIDATION_FRACTION,
+    ) -> "Surrogate":
+        """Fit by least squares on the draws of a result store, holding out the last draws for validation.
+
+        The inputs of the draws are recomputed from the scenario, columns with missing values are not fitted.
+        The validation error is the root mean square residual on the held-out draws relative to their standard
+        deviation.
+        """
+        df = ResultStore(directory).load(properties)
+        z = scenario.normalize(scenario.draws(df.index.to_numpy()))
+        inputs = np.flatnonzero(z.std(axis=0) > 0)
+        exponents = _exponents(len(inputs), degree)
+
+        values = df.to_numpy()
+        fitted = ~np.isnan(values).any(axis=0)
+
+        training = int(len(df) * (1 - validation_fraction))
+        if training < len(exponents):
+            raise ValueError(f"{training} training draws are too few for {len(exponents)} expansion terms.")
+
+        basis = _basis(z[:, inputs], exponents)
+        coefficients = np.full((len(exponents), len(df.columns)), np.nan)
+        coefficients[:, fitted] = np.linalg.lstsq(basis[:training], values[:training, fitted], rcond=None)[0]
+
+        held_out = values[training:]
+        residuals = basis[training:] @ coefficients - held_out
+        with np.errstate(divide="ignore", invalid="ignore"):
+            error = np.sqrt(np.mean(residuals**2, axis=0)) / np.std(held_out, axis=0)
+
+        return cls(scenario, df.columns, inputs, exponents, coefficients, pd.Series(error, index=df.columns))
+
+    def predict_normalized(self, z: np.ndarray) -> np.ndarray:
+        return _basis(np.asarray(z)[:, self.inputs], self.exponents) @ self.coefficients
+
+    def predict(self, draws: list[DrawInput]) -> pd.DataFrame:
+        """Evaluate the surrogate for arbitrary draws, e.g. those of scenarios with other standard deviations."""
+        return pd.DataFrame(self.predict_normalized(self.scenario.normalize(draws)), columns=self.columns)
+
+    def moments(self) -> pd.DataFrame:
+        """Mean and standard deviation under the input distributions of the fitted scenario."""
+        return pd.DataFrame(
+            {
+                "mean": self.coefficients[0],
+                "std": np.sqrt((self.coefficients[1:] ** 2).sum(axis=0)),
+            },
+            index=self.columns,
+        ).T
@@ -0,0 +1,103 @@
+import itertools
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from weiner_variation.sim.config import SEED
+from weiner_variation.sim.data import DrawParameters
+from weiner_variation.sim.process import DIAMETER, TEMPERATURE
+from weiner_variation.sim.runner import Design, Scenario, run
+from weiner_variation.sim.sampling import SAMPLERS, sample_uniforms
+from weiner_variation.sim.store import ResultStore
+
+DESIGNS = ["grid", *SAMPLERS]
+# the points of random designs are drawn from a stream of their own, as the base scenario draws its inputs from the
+# default stream of the same seed
+POINTS_STREAM = (1,)
+
+
+@dataclass
+class Sweep(Design):
+    """Design over process parameters, each point being evaluated with the draws of a base scenario.
+
+    Parameters are given by the names accepted by ``process.set_parameter`` plus ``DIAMETER`` and ``TEMPERATURE``,
+    which shift the nominal input values.
+    Grid designs take a list of values per parameter, random designs a ``(low, high)`` range to sample with the
+    sampler of the same name.
+    """
+
+    name: str
+    parameters: dict[str, list[float] | tuple[float, float]]
+    design: str = "grid"
+    point_count: int = 0
+    seed: int = SEED
+    base: Scenario = field(
+        default_factory=lambda: Scenario("nominal", diameter_std=0, temperature_std=0, sample_count=1)
+    )
+
+    def __post_init__(self):
+        if self.design not in DESIGNS:
+            raise ValueError(f"Unknown design '{self.design}', must be one of {DESIGNS}.")
+
+    @property
+    def points(self) -> pd.DataFrame:
+        names = list(self.parameters)
+
+        if self.design == "grid":
+            return pd.DataFrame(list(itertools.product(*self.parameters.values())), columns=names)
+
+        bounds = np.array([self.parameters[n] for n in names], dtype=float)
+        indices = np.arange(self.point_count)
+        u = sample_uniforms(self.design, self.seed, len(names), indices, self.point_count, POINTS_STREAM)
+        return pd.DataFrame(bounds[:, 0] + u * (bounds[:, 1] - bounds[:, 0]), columns=names)
+
+    @property
+    def sample_count(self) -> int:
+        return len(self.points) * self.base.sample_count
+
+    def transform(self, indices: np.ndarray) -> list[DrawParameters]:
+        points = self.points.to_dict("records")
+        point_indices, base_indices = np.divmod(indices, self.base.sample_count)
+
+        # all points share the draws of the base scenario (common random numbers)
+        draws = []
+        for p, base_draw in zip(point_indices, self.base.draws(base_indices), strict=True):
+            parameters = dict(points[p])
+            # shifts are exactly zero for points not varying the inputs, keeping the inputs of the base draws
+            diameter_shift = parameters.pop("DIAMETER", DIAMETER) - DIAMETER
+            temperature_shift = parameters.pop("TEMPERATURE", TEMPERATURE) - TEMPERATURE
+            draws.append(
+                DrawParameters(
+                    base_draw.diameter + diameter_shift,
+                    base_draw.temperature + temperature_shift,
+                    parameters,
+                    getattr(base_draw, "durations", None),
+                )
+            )
+        return draws
+
+
+def run_sweep(sweep: Sweep, output_dir: Path, **kwargs) -> ResultStore:
+    store = run(sweep, output_dir, **kwargs)
+    store.write_meta(
+        parameters=list(sweep.parameters),
+        points=sweep.points.to_numpy().tolist(),
+        base_sample_count=sweep.base.sample_count,
+    )
+    return store
+
+
+def load_sweep(directory: Path, properties: list[str] | None = None) -> pd.DataFrame:
+    """Results of a sweep indexed by the parameter values of each point and the draw of the base scenario."""
+    store = ResultStore(directory)
+    df = store.load(properties)
+
+    points = np.array(store.meta["points"])
+    point_indices, base_indices = np.divmod(df.index.to_numpy(), store.meta["base_sample_count"])
+    df.index = pd.MultiIndex.from_arrays(
+        [*points[point_indices].T, base_indices],
+        names=[*store.meta["parameters"], "draw"],
+    )
+    return df
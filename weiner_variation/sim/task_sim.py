@@ -1,22 +1,24 @@
-import papermill
-import pytask
-
 from weiner_variation.config import DATA_DIR, SIM_DIR
 from weiner_variation.sim.config import SIMS
+from weiner_variation.sim.runner import run_all
+from weiner_variation.sim.scenarios import SCENARIOS, STD_SCENARIOS
+
+RESULTS = {sim: DATA_DIR / f"sim_{sim}_results" for sim in SIMS} | {
+    (sim, f): DATA_DIR / f"sim_{sim}_stds_results" / f"{f}" for sim, f in STD_SCENARIOS
+}
 
-for sim in SIMS:
 
-    @pytask.task(id=sim)
-    def task_sim(
-        notebook=SIM_DIR / f"sim_{sim}.ipynb",
-        config_file=SIM_DIR / "config.py",
-        process_file=SIM_DIR / "process.py",
-        produces=DATA_DIR / f"sim_{sim}_results.csv",
-    ):
-        papermill.execute_notebook(
-            notebook,
-            notebook.with_suffix(".out.ipynb"),
-            parameters={
-                "OUTPUT_FILENAME": str(produces),
-            },
-        )
+def task_sim(
+    config_file=SIM_DIR / "config.py",
+    process_file=SIM_DIR / "process.py",
+    runner_file=SIM_DIR / "runner.py",
+    batch_file=SIM_DIR / "batch.py",
+    sampling_file=SIM_DIR / "sampling.py",
+    store_file=SIM_DIR / "store.py",
+    scenarios_file=SIM_DIR / "scenarios.py",
+    produces=RESULTS,
+):
+    # one pool for all scenarios keeps the workers busy across scenario boundaries,
+    # scenarios with unchanged hash, which covers the solver and draw generation code and settings, are skipped by
+    # resuming their complete stores
+    run_all({produces[k]: (SCENARIOS | STD_SCENARIOS)[k] for k in RESULTS})
@@ -0,0 +1,35 @@
+import pandas as pd
+
+from weiner_variation.config import DATA_DIR, MATERIAL, SIM_DIR
+from weiner_variation.data.config import PASSES_FILES
+from weiner_variation.sim.calibration import calibrate, load_measurements
+from weiner_variation.sim.runner import run
+from weiner_variation.sim.scenarios import CALIBRATION_SCENARIO
+from weiner_variation.sim.surrogate import Surrogate
+
+RESULTS_DIR = DATA_DIR / "sim_calibration_results"
+
+
+def task_sim_calibration(
+    config_file=SIM_DIR / "config.py",
+    process_file=SIM_DIR / "process.py",
+    runner_file=SIM_DIR / "runner.py",
+    batch_file=SIM_DIR / "batch.py",
+    produces=RESULTS_DIR,
+):
+    run(CALIBRATION_SCENARIO, produces)
+
+
+def task_calibration(
+    calibration_file=SIM_DIR / "calibration.py",
+    surrogate_file=SIM_DIR / "surrogate.py",
+    measurements_file=DATA_DIR / "measurements.py",
+    results=RESULTS_DIR,
+    input_dist_file=DATA_DIR / "input_dist.csv",
+    exp=PASSES_FILES[MATERIAL],
+    produces=DATA_DIR / "calibrated_input_dist.csv",
+):
+    surrogate = Surrogate.fit(results, CALIBRATION_SCENARIO)
+    input_dist = pd.read_csv(input_dist_file, index_col=0)
+    calibrated, _ = calibrate(surrogate, load_measurements(exp), input_dist)
+    calibrated.to_csv(produces)
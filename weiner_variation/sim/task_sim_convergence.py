@@ -0,0 +1,70 @@
+from dataclasses import replace
+
+import pandas as pd
+import pytask
+
+from weiner_variation.config import DATA_DIR, SIM_DIR
+from weiner_variation.sim.config import (
+    CONVERGENCE_PROPERTIES,
+    CONVERGENCE_REPLICATES,
+    CONVERGENCE_SAMPLE_COUNT,
+    CONVERGENCE_SAMPLE_SIZES,
+    SEED,
+)
+from weiner_variation.sim.runner import run
+from weiner_variation.sim.sampling import SAMPLERS
+from weiner_variation.sim.scenarios import SCENARIOS
+from weiner_variation.sim.store import load_results
+
+RESULTS_DIR = DATA_DIR / "sim_convergence_results"
+
+# prefixes of a Latin hypercube are no Latin hypercubes, so it is drawn separately for each sample size
+RUNS = {
+    (sampler, replicate, n): RESULTS_DIR / sampler / str(replicate) / (str(n) if sampler == "lhs" else "")
+    for sampler in SAMPLERS
+    for replicate in range(CONVERGENCE_REPLICATES)
+    for n in (CONVERGENCE_SAMPLE_SIZES if sampler == "lhs" else [CONVERGENCE_SAMPLE_COUNT])
+}
+
+for (sampler, replicate, n), path in RUNS.items():
+
+    @pytask.task(id=f"{sampler}/{replicate}/{n}")
+    def task_sim_convergence(
+        config_file=SIM_DIR / "config.py",
+        process_file=SIM_DIR / "process.py",
+        runner_file=SIM_DIR / "runner.py",
+        batch_file=SIM_DIR / "batch.py",
+        sampling_file=SIM_DIR / "sampling.py",
+        produces=path,
+        scenario=replace(
+            SCENARIOS["input"],
+            name=f"convergence/{sampler}/{replicate}/{n}",
+            sampler=sampler,
+            seed=SEED + replicate,
+            sample_count=n,
+        ),
+    ):
+        run(scenario, produces)
+
+
+def task_sampling_convergence(
+    depends_on=RUNS,
+    produces=DATA_DIR / "sampling_convergence.csv",
+):
+    # the spread of the estimates over the independent replicates needs no reference solution, whose own sampling
+    # error would be of the size of the differences between the samplers
+    dfs = {k: load_results(p, CONVERGENCE_PROPERTIES) for k, p in depends_on.items()}
+
+    def sample(sampler, replicate, n):
+        if sampler == "lhs":
+            return dfs[sampler, replicate, n]
+        return dfs[sampler, replicate, CONVERGENCE_SAMPLE_COUNT].iloc[:n]
+
+    rows = []
+    for sampler in SAMPLERS:
+        for n in CONVERGENCE_SAMPLE_SIZES:
+            estimates = pd.concat([sample(sampler, r, n).std() for r in range(CONVERGENCE_REPLICATES)], axis=1)
+            spread = estimates.std(axis=1) / estimates.mean(axis=1)
+            rows.append({"sampler": sampler, "sample_count": n} | spread.groupby(level=0).mean().to_dict())
+
+    pd.DataFrame(rows).to_csv(produces, index=False)
@@ -0,0 +1,46 @@
+import pandas as pd
+import pytask
+
+from weiner_variation.config import DATA_DIR, SIM_DIR
+from weiner_variation.sim.config import TAIL_EVENTS
+from weiner_variation.sim.importance import ImportanceDesign, design_point, run_importance, tail_probability
+from weiner_variation.sim.linearization import LinearizationDesign, propagate
+from weiner_variation.sim.scenarios import SCENARIOS
+from weiner_variation.sim.store import ResultStore, load_results
+
+BASE = SCENARIOS["input"]
+LINEARIZATION_RESULTS = DATA_DIR / "sim_input_linearization_results"
+
+for name, (prop, unit, threshold) in TAIL_EVENTS.items():
+    results_dir = DATA_DIR / f"sim_importance_{name}_results"
+
+    @pytask.task(id=name)
+    def task_sim_importance(
+        config_file=SIM_DIR / "config.py",
+        process_file=SIM_DIR / "process.py",
+        runner_file=SIM_DIR / "runner.py",
+        batch_file=SIM_DIR / "batch.py",
+        importance_file=SIM_DIR / "importance.py",
+        linear=LINEARIZATION_RESULTS,
+        produces=results_dir,
+        name=name,
+        column=(prop, unit),
+        threshold=threshold,
+    ):
+        linear_results = propagate(load_results(linear), LinearizationDesign("linearization/input", BASE))
+        design = ImportanceDesign(f"importance/{name}", BASE, design_point(linear_results, column, threshold))
+        run_importance(design, produces)
+
+
+@pytask.task
+def task_tail_probabilities(
+    results={name: DATA_DIR / f"sim_importance_{name}_results" for name in TAIL_EVENTS},
+    produces=DATA_DIR / "tail_probabilities.csv",
+):
+    estimates = {}
+    for name, (prop, unit, threshold) in TAIL_EVENTS.items():
+        store = ResultStore(results[name])
+        design = ImportanceDesign(f"importance/{name}", BASE, store.meta["shift"])
+        estimates[name] = tail_probability(store.load([prop]), design, (prop, unit), threshold)
+
+    pd.DataFrame(estimates).T.to_csv(produces)
@@ -0,0 +1,33 @@
+import pytask
+
+from weiner_variation.config import DATA_DIR, SIM_DIR
+from weiner_variation.sim.linearization import LinearizationDesign, compare, propagate
+from weiner_variation.sim.runner import run
+from weiner_variation.sim.scenarios import SCENARIOS
+from weiner_variation.sim.store import load_results, load_summary
+
+for sim in ["input", "durations"]:
+    design = LinearizationDesign(f"linearization/{sim}", SCENARIOS[sim])
+    results_dir = DATA_DIR / f"sim_{sim}_linearization_results"
+
+    @pytask.task(id=sim)
+    def task_sim_linearization(
+        config_file=SIM_DIR / "config.py",
+        process_file=SIM_DIR / "process.py",
+        runner_file=SIM_DIR / "runner.py",
+        batch_file=SIM_DIR / "batch.py",
+        linearization_file=SIM_DIR / "linearization.py",
+        produces=results_dir,
+        design=design,
+    ):
+        run(design, produces)
+
+    @pytask.task(id=sim)
+    def task_linearization_comparison(
+        linear=results_dir,
+        mc=DATA_DIR / f"sim_{sim}_results",
+        produces=DATA_DIR / f"linearization_{sim}.csv",
+        design=design,
+    ):
+        linear_results = propagate(load_results(linear), design)
+        compare(linear_results, load_summary(mc)).to_csv(produces)
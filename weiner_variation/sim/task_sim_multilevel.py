@@ -0,0 +1,31 @@
+import pytask
+
+from weiner_variation.config import DATA_DIR, SIM_DIR
+from weiner_variation.sim.multilevel import MultilevelDesign, estimate
+from weiner_variation.sim.runner import run
+from weiner_variation.sim.scenarios import SCENARIOS
+from weiner_variation.sim.store import load_results
+
+for sim in ["input", "durations"]:
+    design = MultilevelDesign(f"multilevel/{sim}", SCENARIOS[sim])
+    results_dir = DATA_DIR / f"sim_{sim}_multilevel_results"
+
+    @pytask.task(id=sim)
+    def task_sim_multilevel(
+        config_file=SIM_DIR / "config.py",
+        process_file=SIM_DIR / "process.py",
+        runner_file=SIM_DIR / "runner.py",
+        batch_file=SIM_DIR / "batch.py",
+        multilevel_file=SIM_DIR / "multilevel.py",
+        produces=results_dir,
+        design=design,
+    ):
+        run(design, produces)
+
+    @pytask.task(id=sim)
+    def task_multilevel_estimate(
+        results=results_dir,
+        produces=DATA_DIR / f"multilevel_{sim}.csv",
+        design=design,
+    ):
+        estimate(load_results(results), design).T.to_csv(produces)
@@ -0,0 +1,31 @@
+from weiner_variation.config import DATA_DIR, SIM_DIR
+from weiner_variation.sim.config import SENSITIVITY_PROPERTIES
+from weiner_variation.sim.runner import run
+from weiner_variation.sim.scenarios import SCENARIOS
+from weiner_variation.sim.sensitivity import SaltelliDesign, sobol_indices
+from weiner_variation.sim.store import load_results
+
+DESIGN = SaltelliDesign("sensitivity", SCENARIOS["durations"])
+RESULTS_DIR = DATA_DIR / "sim_sensitivity_results"
+
+
+def task_sim_sensitivity(
+    config_file=SIM_DIR / "config.py",
+    process_file=SIM_DIR / "process.py",
+    runner_file=SIM_DIR / "runner.py",
+    batch_file=SIM_DIR / "batch.py",
+    sensitivity_file=SIM_DIR / "sensitivity.py",
+    produces=RESULTS_DIR,
+    design=DESIGN,
+):
+    run(design, produces)
+
+
+def task_sensitivity_indices(
+    results=RESULTS_DIR,
+    produces=DATA_DIR / "sensitivity_indices.csv",
+    design=DESIGN,
+):
+    df = load_results(results, SENSITIVITY_PROPERTIES)
+    indices = sobol_indices(df, design)
+    indices.stack([0, 1]).rename("value").to_csv(produces)
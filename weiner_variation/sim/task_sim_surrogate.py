@@ -0,0 +1,22 @@
+import pandas as pd
+import pytask
+
+from weiner_variation.config import DATA_DIR, SIM_DIR
+from weiner_variation.sim.config import CONVERGENCE_PROPERTIES
+from weiner_variation.sim.scenarios import SCENARIOS
+from weiner_variation.sim.surrogate import Surrogate
+
+for sim in ["input", "durations"]:
+
+    @pytask.task(id=sim)
+    def task_surrogate_validation(
+        config_file=SIM_DIR / "config.py",
+        surrogate_file=SIM_DIR / "surrogate.py",
+        results=DATA_DIR / f"sim_{sim}_results",
+        produces=DATA_DIR / f"surrogate_{sim}.csv",
+        scenario=SCENARIOS[sim],
+    ):
+        surrogate = Surrogate.fit(results, scenario, CONVERGENCE_PROPERTIES)
+        pd.concat(
+            [surrogate.moments().T, surrogate.validation_error.rename("validation_error")], axis=1
+        ).to_csv(produces)
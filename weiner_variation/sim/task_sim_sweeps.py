@@ -0,0 +1,19 @@
+import pytask
+
+from weiner_variation.config import DATA_DIR, SIM_DIR
+from weiner_variation.sim.scenarios import SWEEPS
+from weiner_variation.sim.sweep import run_sweep
+
+for name, sweep in SWEEPS.items():
+
+    @pytask.task(id=name)
+    def task_sim_sweep(
+        config_file=SIM_DIR / "config.py",
+        process_file=SIM_DIR / "process.py",
+        runner_file=SIM_DIR / "runner.py",
+        batch_file=SIM_DIR / "batch.py",
+        sweep_file=SIM_DIR / "sweep.py",
+        produces=DATA_DIR / f"sweep_{name}_results",
+        sweep=sweep,
+    ):
+        run_sweep(sweep, produces)